@@ -4,8 +4,7 @@ Configuration management for the Asset Browser.
 
 import os
 import json
-from PySide6.QtCore import QThreadPool
-from ..config.constants import DEFAULT_SETTINGS
+from ..config.constants import DEFAULT_SETTINGS, DECODE_THREADS_DEFAULT_MAX
 from ..utils.logging_config import LOGGER
 
 try:
@@ -23,9 +22,14 @@ class ConfigManager:
         self.default_settings = DEFAULT_SETTINGS.copy()
         
         # Update defaults based on system
-        self.default_settings['thread_count'] = QThreadPool.globalInstance().maxThreadCount()
+        self.default_settings['thread_count'] = self.default_thread_count()
         self.default_settings['use_oiio'] = oiio is not None
     
+    @staticmethod
+    def default_thread_count() -> int:
+        """Get the default decode thread count: one per core, up to DECODE_THREADS_DEFAULT_MAX."""
+        return min(os.cpu_count() or 1, DECODE_THREADS_DEFAULT_MAX)
+
     def load_settings(self):
         """Load settings from config file, return defaults if file doesn't exist."""
         try:
@@ -3,15 +3,32 @@ Constants and configuration settings for the Asset Browser.
 """
 
 # Supported file extensions
-SUPPORTED_VIDEO_EXTS = {".mp4", ".mov", ".avi", ".mkv", ".webm"}
-SUPPORTED_IMAGE_EXTS = {
+SUPPORTED_VIDEO_EXTS = frozenset({".mp4", ".mov", ".avi", ".mkv", ".webm"})
+SUPPORTED_IMAGE_EXTS = frozenset({
     ".jpg", ".jpeg", ".png", ".bmp", ".tiff", ".tif", ".gif",
     ".exr", ".hdr", ".dpx", ".psd", ".svg", ".jp2"
-}
+})
+SUPPORTED_ASSET_EXTS = SUPPORTED_IMAGE_EXTS | SUPPORTED_VIDEO_EXTS
+JPEG_EXTS = frozenset({".jpg", ".jpeg"})  # Eligible for the libjpeg-turbo decode path
 
 # Thumbnail settings
 THUMB_BG = (28, 28, 30)  # Background color for thumbnails
-THUMB_CACHE_VERSION = "2"  # Cache version for invalidation
+THUMB_CACHE_VERSION = "5"  # Cache version for invalidation
+THUMB_CANONICAL_SIZE = 512  # Width of generated and cached thumbnails; views scale for display
+THUMB_BATCH_SIZE = 16  # Default files per ThumbBatchTask ('thumb_batch_size' setting)
+THUMB_PREFETCH_ROWS = 2  # Rows beyond the viewport whose thumbnails are requested ahead of scrolling
+# In-memory thumbnails kept per MB of 'max_cache_size': whole canonical-size
+# 16:9 RGBA pixmaps (~590KB each) that fit in a MB, at least one
+PIXMAP_CACHE_ITEMS_PER_MB = max(1, 1024 * 1024 // (THUMB_CANONICAL_SIZE * (THUMB_CANONICAL_SIZE * 9 // 16) * 4))
+LIST_ICON_CACHE_SIZE = 4096  # Scaled list view thumbnail icons kept for reuse
+ASSET_INFO_WORKERS = 8  # Threads reading file info for list view bulk loads
+DECODE_THREADS_DEFAULT_MAX = 8  # Cap on the default thumbnail decode thread count (one per core)
+IO_THREADS_MIN = 4  # Floor on the cache probe pool size (two threads per core)
+SEARCH_DEBOUNCE_MS = 150  # Idle time after the last search keystroke before refreshing
+SEARCH_CACHE_SIZE = 32  # Filtered results kept per folder listing for repeated search queries
+QPIXMAPCACHE_LIMIT_KB = 40 * 1024  # QPixmapCache budget for placeholders and scaled previews
+PREVIEW_SMOOTH_DELAY_MS = 120  # Idle time after a preview resize before the smooth rescale
+SETTINGS_SAVE_DELAY_MS = 500  # Idle time after a UI toggle before settings are written
 
 # Default settings
 DEFAULT_SETTINGS = {
@@ -22,6 +39,7 @@ DEFAULT_SETTINGS = {
     'show_tree_view': True,
     'view_mode': 'grid',  # 'grid' or 'list'
     'thread_count': 4,  # Will be updated to actual CPU count
+    'thumb_batch_size': THUMB_BATCH_SIZE,
     'preload_thumbnails': True,
     'max_cache_size': 100,
     'auto_clear_cache': False,
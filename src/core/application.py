@@ -3,8 +3,10 @@ Main application class for the Asset Browser.
 """
 
 import sys
+from PySide6.QtGui import QPixmapCache
 from PySide6.QtWidgets import QApplication
 from ..ui.main_window import MainWindow
+from ..config.constants import QPIXMAPCACHE_LIMIT_KB
 
 
 class AssetBrowserApp:
@@ -17,6 +19,7 @@ class AssetBrowserApp:
     def run(self, start_dir=None):
         """Run the Asset Browser application."""
         self.app = QApplication(sys.argv)
+        QPixmapCache.setCacheLimit(QPIXMAPCACHE_LIMIT_KB)
         self.main_window = MainWindow(start_dir)
         self.main_window.show()
         return self.app.exec()
@@ -3,12 +3,33 @@ Thumbnail generation data structures and utilities.
 """
 
 import os
+import mmap
+import struct
 import hashlib
+import threading
 import numpy as np
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Optional
+from typing import Dict, Hashable, Iterable, Optional, Tuple
 from PySide6.QtGui import QPixmap
-from ..config.constants import THUMB_CACHE_VERSION
+from ..config.constants import THUMB_CACHE_VERSION, PIXMAP_CACHE_ITEMS_PER_MB, DEFAULT_SETTINGS
+
+# Raw thumbnail file header: magic, height, width, channels
+THUMB_FILE_MAGIC = b"THMB"
+THUMB_FILE_HEADER = struct.Struct("<4sIII")
+
+# Import xxhash if available (much cheaper per call than hashlib for tiny payloads)
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+
+def _digest64(payload: bytes) -> str:
+    """Return a 64-bit hex digest of payload for use as a cache key."""
+    if xxhash is not None:
+        return xxhash.xxh3_64_hexdigest(payload)
+    return hashlib.blake2b(payload, digest_size=8).hexdigest()
 
 
 @dataclass
@@ -16,30 +37,150 @@ class ThumbResult:
     """Result data structure for thumbnail generation."""
     path: str
     pixmap: Optional[QPixmap]
-    meta_text: str
+    meta_text: Optional[str]  # None when metadata is read on demand (ImageProcessor.read_metadata)
+
+
+class PixmapMemoryCache:
+    """Thread-safe in-process LRU cache of decoded thumbnails.
+
+    Entries are ``(pixmap, meta_text)`` tuples keyed by
+    ``(path, mtime_ns)`` so a modified file never hits a stale entry.
+    """
+
+    def __init__(self, max_items: int):
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+        self.max_items = max(1, max_items)
+
+    @staticmethod
+    def key_for(path: str, st: os.stat_result) -> Tuple[str, int]:
+        """Get the cache key for a file from its stat result."""
+        return (path, st.st_mtime_ns)
+
+    def get(self, key: Hashable) -> Optional[Tuple[QPixmap, Optional[str]]]:
+        """Return the cached entry for key, marking it most recently used."""
+        with self._lock:
+            entry = self._items.get(key)
+            if entry is not None:
+                self._items.move_to_end(key)
+            return entry
+
+    def put(self, key: Hashable, pixmap: QPixmap, meta_text: Optional[str]):
+        """Insert an entry, evicting the least recently used ones on overflow."""
+        with self._lock:
+            self._items[key] = (pixmap, meta_text)
+            self._items.move_to_end(key)
+            while len(self._items) > self.max_items:
+                self._items.popitem(last=False)
+
+    def set_max_items(self, max_items: int):
+        """Resize the cache, evicting old entries if it shrank."""
+        with self._lock:
+            self.max_items = max(1, max_items)
+            while len(self._items) > self.max_items:
+                self._items.popitem(last=False)
+
+    def clear(self):
+        """Drop all cached entries."""
+        with self._lock:
+            self._items.clear()
+
+
+# Process-wide cache shared by all ThumbBatchTask workers
+PIXMAP_CACHE = PixmapMemoryCache(DEFAULT_SETTINGS['max_cache_size'] * PIXMAP_CACHE_ITEMS_PER_MB)
 
 
 class CacheManager:
     """Manages thumbnail cache operations."""
+
+    # Cache subdirectories already created by this process
+    _created_dirs = set()
+    _created_dirs_lock = threading.Lock()
     
-    @staticmethod
-    def hash_for_file(path: str) -> str:
+    @classmethod
+    def hash_for_file(cls, path: str) -> str:
         """Generate a hash for the file for cache key."""
         try:
             st = os.stat(path)
-            payload = f"{THUMB_CACHE_VERSION}|{path}|{st.st_mtime_ns}|{st.st_size}".encode()
         except FileNotFoundError:
-            payload = f"{THUMB_CACHE_VERSION}|{path}".encode()
-        return hashlib.sha1(payload).hexdigest()
+            return _digest64(f"{THUMB_CACHE_VERSION}|{path}".encode())
+        return cls.hash_for_file_stat(path, st)
+
+    @staticmethod
+    def hash_for_file_stat(path: str, st: os.stat_result) -> str:
+        """Generate a cache key hash from an already available stat result."""
+        payload = f"{THUMB_CACHE_VERSION}|{path}|{st.st_mtime_ns}|{st.st_size}".encode()
+        return _digest64(payload)
 
     @classmethod
-    def get_cache_path(cls, cache_root: str, src_path: str) -> str:
+    def batch_hash(cls, entries: Iterable[os.DirEntry]) -> Dict[str, str]:
+        """Hash a batch of os.scandir entries, returning {path: hash}.
+
+        Uses the stat cached on each entry, with the same key as hash_for_file.
+        """
+        hashes = {}
+        for entry in entries:
+            try:
+                hashes[entry.path] = cls.hash_for_file_stat(entry.path, entry.stat())
+            except FileNotFoundError:
+                hashes[entry.path] = cls.hash_for_file(entry.path)
+        return hashes
+
+    @classmethod
+    def get_cache_path(cls, cache_root: str, src_path: str, st: Optional[os.stat_result] = None) -> str:
         """Get the cache file path for a given source file."""
-        h = cls.hash_for_file(src_path)
+        if st is not None:
+            h = cls.hash_for_file_stat(src_path, st)
+        else:
+            h = cls.hash_for_file(src_path)
+        return cls.cache_path_for_hash(cache_root, h)
+
+    @classmethod
+    def cache_path_for_hash(cls, cache_root: str, h: str) -> str:
+        """Get the cache file path for an already computed cache key hash."""
         sub = os.path.join(cache_root, h[:2])
-        os.makedirs(sub, exist_ok=True)
-        return os.path.join(sub, f"{h}.png")
+        if sub not in cls._created_dirs:
+            os.makedirs(sub, exist_ok=True)
+            with cls._created_dirs_lock:
+                cls._created_dirs.add(sub)
+        return os.path.join(sub, f"{h}.thumb")
+
+    @classmethod
+    def forget_created_dirs(cls):
+        """Forget which cache subdirectories exist, e.g. after a cache folder was removed."""
+        with cls._created_dirs_lock:
+            cls._created_dirs.clear()
     
+    @staticmethod
+    def read_cached_thumbnail(cache_path: str) -> Optional[np.ndarray]:
+        """Read a raw BGR cached thumbnail through a read-only memory map.
+
+        Mapping the file lets repeated hits be served from the OS page cache
+        without an intermediate read buffer. Returns None if the file is
+        missing, truncated or not a thumbnail file.
+        """
+        try:
+            with open(cache_path, "rb") as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    magic, h, w, c = THUMB_FILE_HEADER.unpack_from(mm)
+                    if magic != THUMB_FILE_MAGIC or len(mm) != THUMB_FILE_HEADER.size + h * w * c:
+                        return None
+                    pixels = np.frombuffer(mm, dtype=np.uint8, offset=THUMB_FILE_HEADER.size)
+                    # Copy out so the map can be closed once the buffer is released
+                    img = pixels.reshape(h, w, c).copy()
+                    del pixels
+            return img
+        except (OSError, ValueError, struct.error):
+            return None
+
+    @staticmethod
+    def write_cached_thumbnail(cache_path: str, img: np.ndarray):
+        """Write a BGR uint8 thumbnail as a raw header + pixel buffer (no PNG compression)."""
+        h, w, c = img.shape
+        with open(cache_path, "wb") as f:
+            f.write(THUMB_FILE_HEADER.pack(THUMB_FILE_MAGIC, h, w, c))
+            f.write(np.ascontiguousarray(img).data)
+
     @staticmethod
     def generate_cache_root(current_project: Optional[str], folder: str) -> str:
         """Generate cache root directory for the given folder."""
@@ -0,0 +1,57 @@
+"""
+Background measurement of a thumbnail cache folder.
+"""
+
+import os
+from typing import Tuple
+from PySide6.QtCore import QRunnable, Signal, QObject
+from ..utils.logging_config import LOGGER
+
+
+class CacheSizeSignal(QObject):
+    """Signal emitter for cache size measurement."""
+    finished = Signal(int, object, int)  # generation, total size in bytes (may exceed 32 bits), file count
+    failed = Signal(int, str)  # generation, error message
+
+
+class CacheSizeTask(QRunnable):
+    """Total up the files under a cache folder off the GUI thread."""
+
+    def __init__(self, cache_root: str, generation: int = 0):
+        super().__init__()
+        self.signals = CacheSizeSignal()
+        self.cache_root = cache_root
+        self.generation = generation  # Echoed back with the result
+
+    def run(self):
+        """Execute the cache measurement."""
+        try:
+            total_size, file_count = self.cache_size(self.cache_root)
+        except Exception as e:
+            LOGGER.error(f"Failed to read cache info: {e}")
+            self.signals.failed.emit(self.generation, str(e))
+            return
+        self.signals.finished.emit(self.generation, total_size, file_count)
+
+    @staticmethod
+    def cache_size(cache_root: str) -> Tuple[int, int]:
+        """Get the total size in bytes and number of files under cache_root.
+
+        Walks with os.scandir, whose entries already know their type and, on
+        Windows, their size, instead of a separate getsize() stat per file.
+        A missing cache_root counts as empty.
+        """
+        if not os.path.isdir(cache_root):
+            return 0, 0
+        total_size = 0
+        file_count = 0
+        stack = [cache_root]
+        while stack:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    else:
+                        total_size += entry.stat(follow_symlinks=False).st_size
+                        file_count += 1
+        return total_size, file_count
@@ -0,0 +1,52 @@
+"""
+Background removal of thumbnail cache folders.
+"""
+
+import os
+import shutil
+from typing import List
+from PySide6.QtCore import QRunnable, Signal, QObject
+from ..utils.logging_config import LOGGER
+
+
+class ClearCacheSignal(QObject):
+    """Signal emitter for cache clearing."""
+    finished = Signal(int)  # Number of cache folders removed
+    failed = Signal(str)  # Error message
+
+
+class ClearCacheTask(QRunnable):
+    """Remove cache folders off the GUI thread.
+
+    Removes each folder in cache_roots, then walks each folder in scan_roots
+    for old-style .assetbrowser_cache folders and removes those too.
+    """
+
+    def __init__(self, cache_roots: List[str], scan_roots: List[str] = ()):
+        super().__init__()
+        self.signals = ClearCacheSignal()
+        self.cache_roots = list(cache_roots)
+        self.scan_roots = list(scan_roots)
+
+    def run(self):
+        """Execute the cache removal."""
+        try:
+            cleared_count = 0
+            for cache_root in self.cache_roots:
+                if os.path.isdir(cache_root):
+                    shutil.rmtree(cache_root)
+                    LOGGER.info(f"Cleared cache: {cache_root}")
+                    cleared_count += 1
+
+            for scan_root in self.scan_roots:
+                for root, dirs, files in os.walk(scan_root):
+                    if '.assetbrowser_cache' in dirs:
+                        cache_path = os.path.join(root, '.assetbrowser_cache')
+                        shutil.rmtree(cache_path)
+                        dirs.remove('.assetbrowser_cache')
+                        cleared_count += 1
+        except Exception as e:
+            LOGGER.error(f"Failed to clear cache: {e}")
+            self.signals.failed.emit(str(e))
+            return
+        self.signals.finished.emit(cleared_count)
@@ -0,0 +1,69 @@
+"""
+Thumbnail canvas rendering specialized for a fixed thumbnail size.
+"""
+
+import threading
+import cv2
+import numpy as np
+from ..config.constants import THUMB_BG
+
+
+class ThumbnailRenderer:
+    """Renders images centered on a 16:9 thumbnail canvas of a fixed width.
+
+    Each worker thread reuses its own canvas buffer, so the returned array is
+    only valid until the next render call on the same thread. Callers must
+    convert or write it out before rendering again.
+    """
+
+    _instances = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, thumb_size: int):
+        self.thumb_w = thumb_size
+        self.thumb_h = int(thumb_size * 9 / 16)
+        self._tls = threading.local()
+
+    @classmethod
+    def for_size(cls, thumb_size: int) -> "ThumbnailRenderer":
+        """Return the shared renderer for the given thumbnail width."""
+        with cls._instances_lock:
+            renderer = cls._instances.get(thumb_size)
+            if renderer is None:
+                renderer = cls._instances[thumb_size] = cls(thumb_size)
+            return renderer
+
+    def _canvas(self) -> np.ndarray:
+        """Get this thread's canvas buffer, allocating it on first use."""
+        canvas = getattr(self._tls, "canvas", None)
+        if canvas is None:
+            canvas = np.empty((self.thumb_h, self.thumb_w, 3), np.uint8)
+            self._tls.canvas = canvas
+        return canvas
+
+    def blank(self) -> np.ndarray:
+        """Return the canvas filled with the background color."""
+        canvas = self._canvas()
+        canvas[:] = THUMB_BG
+        return canvas
+
+    def render(self, img_bgr: np.ndarray) -> np.ndarray:
+        """Scale img_bgr to fit the canvas, keeping its aspect ratio, and center it."""
+        h, w = img_bgr.shape[:2]
+        scale = min(self.thumb_w / w, self.thumb_h / h)
+        new_w, new_h = max(1, int(w*scale)), max(1, int(h*scale))
+        y0 = (self.thumb_h - new_h)//2
+        x0 = (self.thumb_w - new_w)//2
+
+        # Only the letterbox bands need the background; the image covers the rest
+        canvas = self._canvas()
+        canvas[:y0] = THUMB_BG
+        canvas[y0+new_h:] = THUMB_BG
+        canvas[y0:y0+new_h, :x0] = THUMB_BG
+        canvas[y0:y0+new_h, x0+new_w:] = THUMB_BG
+
+        # INTER_AREA is faster and alias-free when shrinking; keep CUBIC for upscales
+        interpolation = cv2.INTER_AREA if scale < 1.0 else cv2.INTER_CUBIC
+        cv2.resize(img_bgr, (new_w, new_h), dst=canvas[y0:y0+new_h, x0:x0+new_w],
+                   interpolation=interpolation)
+        return canvas
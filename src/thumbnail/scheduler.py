@@ -0,0 +1,154 @@
+"""
+Demand-driven scheduling of thumbnail batches.
+"""
+
+import os
+import threading
+from typing import Callable, Dict, List, Optional
+from PySide6.QtCore import QObject, QThreadPool
+from .cache import ThumbResult, PIXMAP_CACHE
+from .thumb_task import ThumbBatchTask
+from ..config.constants import THUMB_BATCH_SIZE
+from ..utils.logging_config import LOGGER
+
+
+class ThumbScheduler(QObject):
+    """Feed thumbnail batches to the thread pools, most wanted first.
+
+    Requested paths already in PIXMAP_CACHE are served at once on the calling
+    thread. The rest are first probed for cached thumbnails on io_pool; only
+    the misses are decoded on decode_pool, so cache reads never wait behind
+    decodes. Each stage keeps a pending list ordered by the last request and
+    hands at most maxThreadCount() batches to its pool at a time. A new
+    request replaces whatever is still pending, so work for items that
+    scrolled out of view is dropped instead of delaying the ones now on
+    screen; dropped paths are queued again if they are requested later.
+    """
+
+    def __init__(self, decode_pool: QThreadPool, io_pool: QThreadPool,
+                 parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self.decode_pool = decode_pool
+        self.io_pool = io_pool
+        self.batch_size = THUMB_BATCH_SIZE  # Paths per task
+        self._pending: List[str] = []  # Waiting for a probe
+        self._decode_pending: List[str] = []  # Probed without a cache hit, waiting for a decode
+        self._requested = set()  # Paths pending a decode or handed to a pool this refresh
+        self._probes_in_flight = 0  # Batches started and not yet reported back, per stage
+        self._decodes_in_flight = 0
+        self._cache_root = ""
+        self._cache_hashes: Dict[str, str] = {}
+        self._file_stats: Dict[str, os.stat_result] = {}
+        self._generation = 0
+        self._cancelled: Optional[threading.Event] = None
+        self._on_done: Optional[Callable] = None
+
+    def reset(self, cache_root: str, cache_hashes: Dict[str, str], file_stats: Dict[str, os.stat_result],
+              generation: int, cancelled: threading.Event, on_done: Callable):
+        """Start scheduling for a new refresh, forgetting all earlier requests."""
+        self._pending = []
+        self._decode_pending = []
+        self._requested = set()
+        self._probes_in_flight = 0
+        self._decodes_in_flight = 0
+        self._cache_root = cache_root
+        self._cache_hashes = cache_hashes
+        self._file_stats = file_stats
+        self._generation = generation
+        self._cancelled = cancelled
+        self._on_done = on_done
+
+    def request(self, in_view: List[str], prefetch: List[str] = ()):
+        """Replace the pending work with the given paths.
+
+        Paths in view come first, smallest files first since they finish
+        soonest; prefetch paths keep their order after them.
+        """
+        stats = self._file_stats
+        wanted = sorted(in_view, key=lambda p: stats[p].st_size if p in stats else 0)
+        seen = set(wanted)
+        wanted.extend(p for p in prefetch if p not in seen)
+        seen.update(prefetch)
+
+        # Misses that are no longer wanted go back to being unrequested
+        keep = []
+        for path in self._decode_pending:
+            if path in seen:
+                keep.append(path)
+            else:
+                self._requested.discard(path)
+        rank = {path: i for i, path in enumerate(wanted)}
+        keep.sort(key=rank.__getitem__)
+        self._decode_pending = keep
+
+        requested = self._requested
+        pending = []
+        hits = []
+        for path in wanted:
+            if path in requested:
+                continue
+            st = stats.get(path)
+            cached = PIXMAP_CACHE.get(PIXMAP_CACHE.key_for(path, st)) if st is not None else None
+            if cached is None:
+                pending.append(path)
+            else:
+                requested.add(path)
+                hits.append(ThumbResult(path, *cached))
+        self._pending = pending
+        self._submit()
+        if hits:
+            LOGGER.debug("ThumbScheduler memory cache hits: %s", len(hits))
+            self._on_done(self._generation, hits)
+
+    def _submit(self):
+        """Start pending batches while fewer than maxThreadCount() are in flight per pool."""
+        while self._pending and self._probes_in_flight < max(1, self.io_pool.maxThreadCount()):
+            batch = self._take(self._pending)
+            self._requested.update(batch)
+            task = self._new_task(batch, 'probe')
+            task.signals.missed.connect(self._on_probe_missed)
+            task.signals.done.connect(self._on_probe_done)
+            self._probes_in_flight += 1
+            self.io_pool.start(task)
+        while self._decode_pending and self._decodes_in_flight < max(1, self.decode_pool.maxThreadCount()):
+            batch = self._take(self._decode_pending)
+            task = self._new_task(batch, 'decode')
+            task.signals.done.connect(self._on_decode_done)
+            self._decodes_in_flight += 1
+            self.decode_pool.start(task)
+
+    def _take(self, pending: List[str]) -> List[str]:
+        """Remove and return the next batch_size paths from a pending list."""
+        batch = pending[:self.batch_size]
+        del pending[:self.batch_size]
+        return batch
+
+    def _new_task(self, batch: List[str], kind: str) -> ThumbBatchTask:
+        """Create a batch task for the current refresh."""
+        LOGGER.debug("ThumbScheduler start batch: kind=%s, count=%s, pending=%s+%s",
+                     kind, len(batch), len(self._pending), len(self._decode_pending))
+        return ThumbBatchTask(batch, self._cache_root, self._cache_hashes, self._file_stats,
+                              self._generation, self._cancelled, kind)
+
+    def _on_probe_missed(self, generation: int, paths: List[str]):
+        """Queue the paths a probe found no cached thumbnail for to be decoded."""
+        if generation != self._generation:
+            return
+        self._decode_pending.extend(paths)
+
+    def _on_probe_done(self, generation: int, results):
+        """Pass on a probe batch's cache hits and start the next batches."""
+        if generation != self._generation:
+            return
+        self._probes_in_flight -= 1
+        self._submit()
+        if results:
+            self._on_done(generation, results)
+
+    def _on_decode_done(self, generation: int, results):
+        """Pass on a decoded batch and start the next batches."""
+        if generation != self._generation:
+            return
+        self._decodes_in_flight -= 1
+        self._submit()
+        self._on_done(generation, results)
@@ -3,134 +3,202 @@ Thumbnail generation task and threading.
 """
 
 import os
+import threading
 import cv2
-import numpy as np
-from typing import Tuple, Optional
+from typing import Dict, List, Tuple, Optional
 from PySide6.QtCore import QRunnable, Signal, QObject
 from PySide6.QtGui import QPixmap
-from .cache import ThumbResult, CacheManager
+from .cache import ThumbResult, CacheManager, PIXMAP_CACHE
 from .image_processor import ImageProcessor
-from ..utils.file_utils import is_video, is_image, is_in_archive, get_archive_name
+from .renderer import ThumbnailRenderer
+from ..utils.file_utils import is_video, get_extension, is_in_archive, get_archive_name
 from ..utils.logging_config import LOGGER
-from ..config.constants import THUMB_BG
+from ..config.constants import SUPPORTED_VIDEO_EXTS, SUPPORTED_IMAGE_EXTS, JPEG_EXTS, THUMB_CANONICAL_SIZE
 
 
 class ThumbSignal(QObject):
     """Signal emitter for thumbnail generation."""
-    done = Signal(object)  # ThumbResult
+    done = Signal(int, object)  # generation, List[ThumbResult]
+    missed = Signal(int, object)  # generation, paths a probe batch found no cached thumbnail for
 
 
-class ThumbTask(QRunnable):
-    """Thumbnail generation task for threading."""
+class ThumbBatchTask(QRunnable):
+    """Thumbnail generation task for a batch of files sharing one signal emitter.
+
+    Thumbnails are always rendered at THUMB_CANONICAL_SIZE, independent of the
+    UI thumbnail size, so resizing the view never invalidates the cache.
+
+    A 'decode' batch produces a thumbnail for every path. A 'probe' batch only
+    serves memory and disk cache hits, which are I/O bound, and reports the
+    misses through signals.missed to be decoded by a 'decode' batch.
+    """
     
-    def __init__(self, path: str, thumb_size: int, cache_root: str):
+    def __init__(self, paths: List[str], cache_root: str,
+                 cache_hashes: Optional[Dict[str, str]] = None,
+                 file_stats: Optional[Dict[str, os.stat_result]] = None,
+                 generation: int = 0, cancelled: Optional[threading.Event] = None,
+                 kind: str = 'decode'):
         super().__init__()
         self.signals = ThumbSignal()
-        self.path = path
-        self.thumb_size = thumb_size
+        self.paths = paths
+        self.kind = kind
+        self.generation = generation  # Refresh this batch belongs to, echoed back with the results
+        self.cancelled = cancelled  # Set once the refresh is superseded
+        self.thumb_size = THUMB_CANONICAL_SIZE
         self.cache_root = cache_root
-        self.image_processor = ImageProcessor()
+        self.cache_hashes = cache_hashes or {}  # Precomputed by CacheManager.batch_hash, if available
+        self.file_stats = file_stats or {}  # Stat results from the directory scan, if available
+        self.renderer = ThumbnailRenderer.for_size(THUMB_CANONICAL_SIZE)
 
     def run(self):
         """Execute the thumbnail generation task."""
-        LOGGER.debug(f"ThumbTask start: path={self.path}, size={self.thumb_size}")
-        pixmap, meta_text = self._make_thumbnail(self.path, self.thumb_size, self.cache_root)
-        LOGGER.debug(f"ThumbTask done: path={self.path}, pix={'yes' if pixmap else 'no'}, meta_len={len(meta_text) if meta_text else 0}")
-        self.signals.done.emit(ThumbResult(self.path, pixmap, meta_text))
+        LOGGER.debug("ThumbBatchTask start: kind=%s, count=%s, size=%s", self.kind, len(self.paths), self.thumb_size)
+        results = []
+        misses = []
+        for path in self.paths:
+            if self.cancelled is not None and self.cancelled.is_set():
+                LOGGER.debug("ThumbBatchTask cancelled: generation=%s", self.generation)
+                return
+            if self.kind == 'probe':
+                memory_key, cache_path = self._cache_keys(path, self.cache_root)
+                cached = self._read_cached(path, memory_key, cache_path)
+                if cached is None:
+                    misses.append(path)
+                    continue
+                pixmap, meta_text = cached
+            else:
+                pixmap, meta_text = self._make_thumbnail(path, self.thumb_size, self.cache_root)
+            results.append(ThumbResult(path, pixmap, meta_text))
+        LOGGER.debug("ThumbBatchTask done: count=%s, missed=%s", len(results), len(misses))
+        if misses:
+            self.signals.missed.emit(self.generation, misses)
+        self.signals.done.emit(self.generation, results)
+
+    def _cache_keys(self, path: str, cache_root: str) -> Tuple[Optional[tuple], str]:
+        """Get the in-memory cache key (None if the file cannot be stat'ed) and disk cache path."""
+        st = self.file_stats.get(path)
+        if st is None:
+            try:
+                st = os.stat(path)
+            except OSError:
+                pass
+        memory_key = PIXMAP_CACHE.key_for(path, st) if st is not None else None
+        cache_hash = self.cache_hashes.get(path)
+        if cache_hash:
+            cache_path = CacheManager.cache_path_for_hash(cache_root, cache_hash)
+        else:
+            cache_path = CacheManager.get_cache_path(cache_root, path, st)
+        return memory_key, cache_path
+
+    def _read_cached(self, path: str, memory_key: Optional[tuple],
+                     cache_path: str) -> Optional[Tuple[QPixmap, Optional[str]]]:
+        """Get a cached thumbnail from memory, then disk, or None on a miss."""
+        if memory_key is not None:
+            cached = PIXMAP_CACHE.get(memory_key)
+            if cached is not None:
+                LOGGER.debug("Memory cache hit for %s", path)
+                return cached
 
-    def _make_thumbnail(self, path: str, thumb_size: int, cache_root: str) -> Tuple[Optional[QPixmap], str]:
+        # A missing file reads back as None, so there is no separate exists() probe
+        img = CacheManager.read_cached_thumbnail(cache_path)
+        if img is None:
+            return None
+        LOGGER.debug("Cache hit for %s -> %s", path, cache_path)
+        pixmap = ImageProcessor.to_qpixmap(img, is_bgr=True)
+        # Video metadata feeds the list view's frame range, so read it now;
+        # image metadata is only needed once the item is previewed
+        if is_video(path):
+            meta = ImageProcessor.get_video_metadata(path)
+        else:
+            meta = None
+        if memory_key is not None:
+            PIXMAP_CACHE.put(memory_key, pixmap, meta)
+        return pixmap, meta
+
+    def _make_thumbnail(self, path: str, thumb_size: int, cache_root: str) -> Tuple[Optional[QPixmap], Optional[str]]:
         """Generate thumbnail for the given file."""
-        os.makedirs(cache_root, exist_ok=True)
-        cache_path = CacheManager.get_cache_path(cache_root, path)
-        
-        # Check cache first
-        if os.path.exists(cache_path):
-            LOGGER.debug(f"Cache hit for {path} -> {cache_path}")
-            img = cv2.imread(cache_path, cv2.IMREAD_COLOR)
-            if img is not None:
-                qimg = self.image_processor.to_qimage(img, is_bgr=True)
-                pixmap = QPixmap.fromImage(qimg)
-                # Get appropriate metadata based on file type
-                if is_video(path):
-                    meta = self.image_processor.get_video_metadata(path)
-                else:
-                    meta = self.image_processor.read_metadata_oiio(path)
-                return pixmap, meta
-            else:
-                LOGGER.debug(f"Cache read failed (cv2 returned None) for {cache_path}")
+        # Check in-memory cache first, then the disk cache
+        memory_key, cache_path = self._cache_keys(path, cache_root)
+        cached = self._read_cached(path, memory_key, cache_path)
+        if cached is not None:
+            return cached
 
         img_bgr = None
         meta = ""
         # Normalize path to handle mixed slashes
         normalized_path = os.path.normpath(path)
-        
-        if is_video(normalized_path):
-            LOGGER.debug(f"Loading video frame for {normalized_path}")
-            img_bgr = self.image_processor.extract_frame_video(normalized_path)
+        # Parsed once; every format check below is a set lookup on it
+        ext = get_extension(normalized_path)
+
+        if ext in SUPPORTED_VIDEO_EXTS:
+            LOGGER.debug("Loading video frame for %s", normalized_path)
+            img_bgr = ImageProcessor.extract_frame_video(normalized_path)
             # Use video metadata instead of OIIO metadata for video files
-            meta = self.image_processor.get_video_metadata(normalized_path)
-        elif is_image(normalized_path):
-            LOGGER.debug(f"Loading image via OIIO for {normalized_path}")
-            img_bgr = self.image_processor.read_image_oiio(normalized_path)
-            meta = self.image_processor.read_metadata_oiio(normalized_path)
+            meta = ImageProcessor.get_video_metadata(normalized_path)
+        elif ext in SUPPORTED_IMAGE_EXTS:
+            if ext in JPEG_EXTS:
+                img_bgr = ImageProcessor.read_jpeg_turbo(
+                    normalized_path, self.renderer.thumb_w, self.renderer.thumb_h
+                )
+            if img_bgr is None:
+                LOGGER.debug("Loading image via OIIO for %s", normalized_path)
+                img_bgr, meta = ImageProcessor.read_image_and_metadata_oiio(
+                    normalized_path, self.renderer.thumb_w, self.renderer.thumb_h
+                )
+            else:
+                meta = ImageProcessor.read_metadata_oiio(normalized_path)
             if img_bgr is None:
                 try:
-                    img_bgr = cv2.imread(normalized_path, cv2.IMREAD_COLOR)
+                    img_bgr = ImageProcessor.read_image_cv2(
+                        normalized_path, self.renderer.thumb_w, self.renderer.thumb_h
+                    )
                 except cv2.error:
                     LOGGER.warning(f"OpenCV failed to read image: {normalized_path}")
         else:
             # For unknown extensions, try OpenCV first (safer), then OIIO if enabled
             try:
-                LOGGER.debug(f"Unknown extension, trying OpenCV first for {normalized_path}")
-                img_bgr = cv2.imread(normalized_path, cv2.IMREAD_COLOR)
-                meta = self.image_processor.read_metadata_oiio(normalized_path)
+                LOGGER.debug("Unknown extension, trying OpenCV first for %s", normalized_path)
+                img_bgr = ImageProcessor.read_image_cv2(
+                    normalized_path, self.renderer.thumb_w, self.renderer.thumb_h
+                )
+                meta = ImageProcessor.read_metadata_oiio(normalized_path)
             except cv2.error:
-                LOGGER.debug(f"OpenCV failed, trying OIIO for {normalized_path}")
-                img_bgr = self.image_processor.read_image_oiio(normalized_path)
-                meta = self.image_processor.read_metadata_oiio(normalized_path)
+                LOGGER.debug("OpenCV failed, trying OIIO for %s", normalized_path)
+                img_bgr, meta = ImageProcessor.read_image_and_metadata_oiio(normalized_path)
 
         if img_bgr is None:
-            LOGGER.debug(f"Failed to load media for thumbnail, using placeholder: {path}")
+            LOGGER.debug("Failed to load media for thumbnail, using placeholder: %s", path)
             # Create 16:9 aspect ratio placeholder
-            thumb_height = int(thumb_size * 9 / 16)
-            thumb = np.full((thumb_height, thumb_size, 3), THUMB_BG, np.uint8)
+            thumb_height = self.renderer.thumb_h
+            text_scale = thumb_size / 256
+            thumb = self.renderer.blank()
             
             # Check if it's an archive file to provide appropriate icon
             if is_in_archive(path):
                 # Use archive icon
-                cv2.putText(thumb, "ZIP", (thumb_size//2-20, thumb_height//2+10), 
-                           cv2.FONT_HERSHEY_SIMPLEX, 0.8, (200,200,200), 2, cv2.LINE_AA)
+                cv2.putText(thumb, "ZIP", (thumb_size//2-int(20*text_scale), thumb_height//2+int(10*text_scale)),
+                           cv2.FONT_HERSHEY_SIMPLEX, 0.8*text_scale, (200,200,200), int(2*text_scale), cv2.LINE_AA)
                 archive_name = get_archive_name(path)
                 meta = meta or f"File in compressed archive: {archive_name}\nExtract archive to view content"
             else:
                 # Use generic unknown icon
-                cv2.putText(thumb, "?", (thumb_size//2-10, thumb_height//2+10), 
-                           cv2.FONT_HERSHEY_SIMPLEX, 1.5, (200,200,200), 2, cv2.LINE_AA)
+                cv2.putText(thumb, "?", (thumb_size//2-int(10*text_scale), thumb_height//2+int(10*text_scale)),
+                           cv2.FONT_HERSHEY_SIMPLEX, 1.5*text_scale, (200,200,200), int(2*text_scale), cv2.LINE_AA)
                 meta = meta or "(unsupported or failed to load)"
             
-            qimg = self.image_processor.to_qimage(thumb, is_bgr=True)
-            return QPixmap.fromImage(qimg), meta
-
-        h, w = img_bgr.shape[:2]
-        # Create 16:9 aspect ratio thumbnail
-        thumb_height = int(thumb_size * 9 / 16)
-        
-        # Scale to fit within the 16:9 box while maintaining aspect ratio
-        scale = min(thumb_size / w, thumb_height / h)
-        new_w, new_h = max(1, int(w*scale)), max(1, int(h*scale))
-        resized = cv2.resize(img_bgr, (new_w, new_h), interpolation=cv2.INTER_CUBIC)
-        
-        # Create 16:9 canvas and center the image
-        canvas = np.full((thumb_height, thumb_size, 3), THUMB_BG, np.uint8)
-        y0 = (thumb_height - new_h)//2
-        x0 = (thumb_size - new_w)//2
-        canvas[y0:y0+new_h, x0:x0+new_w] = resized
+            return ImageProcessor.to_qpixmap(thumb, is_bgr=True), meta
+
+        # Create 16:9 aspect ratio thumbnail on this thread's reusable canvas;
+        # it must be written out and converted before the next render
+        canvas = self.renderer.render(img_bgr)
 
         try:
-            cv2.imwrite(cache_path, canvas)
-            LOGGER.debug(f"Wrote cache thumbnail: {cache_path}")
+            CacheManager.write_cached_thumbnail(cache_path, canvas)
+            LOGGER.debug("Wrote cache thumbnail: %s", cache_path)
         except Exception as e:
             LOGGER.warning(f"Failed to write cache {cache_path}: {e}")
 
-        qimg = self.image_processor.to_qimage(canvas, is_bgr=True)
-        return QPixmap.fromImage(qimg), meta
+        pixmap = ImageProcessor.to_qpixmap(canvas, is_bgr=True)
+        if memory_key is not None:
+            PIXMAP_CACHE.put(memory_key, pixmap, meta)
+        return pixmap, meta
@@ -4,20 +4,174 @@ List view widget for displaying assets in a table format.
 
 import os
 import re
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from operator import attrgetter
 from datetime import datetime
-from typing import Optional, Dict, Any
-from PySide6.QtCore import Qt, QSize, QAbstractTableModel, QModelIndex
-from PySide6.QtGui import QPixmap, QIcon
-from PySide6.QtWidgets import QTableView, QHeaderView, QAbstractItemView, QMenu, QStyledItemDelegate, QComboBox
-from ..utils.file_utils import is_video
+import numpy as np
+from typing import Optional, Dict, Any, List, Tuple
+from PySide6.QtCore import (Qt, QSize, QAbstractTableModel, QModelIndex, Signal, QObject,
+                            QRunnable, QThreadPool)
+from PySide6.QtGui import QPixmap, QIcon, QBrush, QColor
+from PySide6.QtWidgets import (QTableView, QHeaderView, QAbstractItemView, QMenu, QStyledItemDelegate,
+                               QComboBox, QStyle, QStyleOptionViewItem)
+from ..utils.file_utils import is_video, classify_paths
+from ..thumbnail.image_processor import ImageProcessor
+from ..config.constants import LIST_ICON_CACHE_SIZE, ASSET_INFO_WORKERS, THUMB_PREFETCH_ROWS
 
+# Custom role returning a dict of every paint-relevant role of a cell at once
+MULTIPLE_ROLES = Qt.UserRole + 100
 
-class StatusDelegate(QStyledItemDelegate):
+# Asset status values, in menu order. Edits store these same string objects,
+# so status lookups compare by identity instead of by characters
+_STATUS_OPTIONS = ("None", "WIP", "Review", "Approved")
+_STATUS_BY_NAME = {status: status for status in _STATUS_OPTIONS}
+
+_FIRST_NUMBER_RE = re.compile(r'(\d+)')
+_FRAMES_RE = re.compile(r'Frames:\s*(\d+)', re.IGNORECASE)
+_SEPARATORS_RE = re.compile(r'[_\-]+')
+
+# Shot name patterns as one alternation; like separate re.match calls, the
+# first alternative that matches wins
+_SHOT_NAME_RE = re.compile(r"""^(?:
+    # Shot00001, Shot_001, shot001, shot_001, etc.
+    (?P<shot>shot[_\-]?\d+)
+    # Any word followed by numbers (like render001, comp001)
+    | (?P<word>[a-zA-Z]+\d+)
+    # Complex shot names like Shot_01_comp_v001
+    | (?P<complex>[^_\.]+_\d+)
+    # Sequence names like seq01_shot01
+    | (?P<seq>seq\d+[_\-]shot\d+)
+    # General: everything before version numbers or large frame sequences
+    | (?P<general>[^\.]+?)(?:_v\d+|_\d{4,}|\.\d{4,}|_version\d+)?$
+)""", re.IGNORECASE | re.VERBOSE)
+
+# Frame number patterns at the end of a name
+_FRAME_TAIL_PATTERNS = [re.compile(p) for p in (
+    r'\.(\d{4,})$',  # .1001, .1002, etc.
+    r'_(\d{4,})$',   # _1001, _1002, etc.
+    r'(\d{4,})$',    # 1001, 1002, etc.
+)]
+
+
+def frame_first_of(frame_range: str) -> int:
+    """First frame number in a frame range string, or 0 if it has none."""
+    match = _FIRST_NUMBER_RE.search(frame_range)
+    return int(match.group(1)) if match else 0
+
+
+class Asset:
+    """One row of the asset list view."""
+
+    __slots__ = ('path', 'basename', 'name_no_ext', 'shot_name', 'frame_range', 'status',
+                 'date_created', 'mtime', 'frame_first', 'thumbnail_icon', 'metadata')
+
+    def __init__(self, path: str, basename: str, name_no_ext: str, shot_name: str, frame_range: str,
+                 status: str, date_created: str, mtime: Optional[float],
+                 thumbnail_icon: Optional[QIcon], metadata: Optional[str]):
+        self.path = path
+        self.basename = basename
+        self.name_no_ext = name_no_ext
+        self.shot_name = shot_name
+        self.frame_range = frame_range
+        self.frame_first = frame_first_of(frame_range)  # Frame Range sort key
+        self.status = status
+        self.date_created = date_created
+        self.mtime = mtime
+        self.thumbnail_icon = thumbnail_icon
+        self.metadata = metadata  # None when read on demand
+
+
+# Per-column getters for DisplayRole and ToolTipRole, indexed by column
+_DISPLAY_GETTERS = (
+    lambda asset: "",  # Thumbnail - no text
+    attrgetter('shot_name'),
+    attrgetter('frame_range'),
+    attrgetter('status'),
+    attrgetter('date_created'),
+)
+_TOOLTIP_GETTERS = (
+    lambda asset: f"File: {asset.basename}",
+    lambda asset: f"Shot: {asset.shot_name}",
+    lambda asset: f"Frame Range: {asset.frame_range}",
+    lambda asset: f"Status: {asset.status} (Double-click to edit)",
+    lambda asset: f"Created: {asset.date_created}",
+)
+
+
+class SpeedUpDelegate(QStyledItemDelegate):
+    """Delegate that fetches all paint roles of a cell with a single data() call.
+
+    The per-cell role dicts are cached until the model reports a change, so
+    repaints while scrolling or hovering skip the model entirely.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._role_cache = {}
+
+    def set_model(self, model):
+        """Invalidate cached roles whenever model changes them."""
+        model.dataChanged.connect(self._on_data_changed)
+        model.modelReset.connect(self.clear_cache)
+        model.layoutChanged.connect(self.clear_cache)
+        model.rowsInserted.connect(self.clear_cache)
+        model.rowsRemoved.connect(self.clear_cache)
+
+    def clear_cache(self, *args):
+        """Drop all cached cell roles."""
+        self._role_cache.clear()
+
+    def _on_data_changed(self, top_left, bottom_right, roles=None):
+        """Drop cached roles for the changed cells only."""
+        for row in range(top_left.row(), bottom_right.row() + 1):
+            for column in range(top_left.column(), bottom_right.column() + 1):
+                self._role_cache.pop((row, column), None)
+
+    def _cell_roles(self, index) -> Dict[int, Any]:
+        """Get the role dict for index, fetching it from the model on a miss."""
+        key = (index.row(), index.column())
+        roles = self._role_cache.get(key)
+        if roles is None:
+            roles = index.data(MULTIPLE_ROLES) or {}
+            self._role_cache[key] = roles
+        return roles
+
+    def initStyleOption(self, option, index):
+        """Fill option from the cached role dict instead of one data() call per role."""
+        roles = self._cell_roles(index)
+        option.index = index
+
+        text = roles.get(Qt.DisplayRole)
+        if text is not None:
+            option.features |= QStyleOptionViewItem.HasDisplay
+            option.text = text
+
+        icon = roles.get(Qt.DecorationRole)
+        if icon is not None:
+            option.features |= QStyleOptionViewItem.HasDecoration
+            option.icon = icon
+            if not option.state & QStyle.State_Enabled:
+                mode = QIcon.Disabled
+            elif option.state & QStyle.State_Selected:
+                mode = QIcon.Selected
+            else:
+                mode = QIcon.Normal
+            state = QIcon.On if option.state & QStyle.State_Open else QIcon.Off
+            option.decorationSize = icon.actualSize(option.decorationSize, mode, state)
+
+        background = roles.get(Qt.BackgroundRole)
+        if background is not None:
+            option.backgroundBrush = QBrush(background)
+
+
+class StatusDelegate(SpeedUpDelegate):
     """Delegate for editing status column with combo box."""
     
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.status_options = ["None", "WIP", "Review", "Approved"]
+        self.status_options = list(_STATUS_OPTIONS)
     
     def createEditor(self, parent, option, index):
         """Create combo box editor for status column."""
@@ -37,10 +191,35 @@ class StatusDelegate(QStyledItemDelegate):
 
 class AssetTableModel(QAbstractTableModel):
     """Table model for displaying asset information in list view."""
+
+    # Status column background colors, built once instead of on every repaint
+    _STATUS_COLORS = {
+        "None": QColor("#f0f0f0"),      # Light gray for no status
+        "WIP": QColor("#fff3cd"),       # Light yellow for work in progress
+        "Review": QColor("#d1ecf1"),    # Light blue for review
+        "Approved": QColor("#d4edda"),  # Light green for approved
+    }
+    _DEFAULT_STATUS_COLOR = QColor("#f0f0f0")  # Default to light gray
+
+    # Non-display roles: role -> handler(model, asset, column)
+    _ROLE_HANDLERS = {
+        Qt.DecorationRole: lambda self, asset, column: asset.thumbnail_icon if column == 0 else None,
+        # Expected size for thumbnail icons
+        Qt.SizeHintRole: lambda self, asset, column: (
+            QSize(self.thumbnail_size, self.thumbnail_size) if column == 0 else None),
+        Qt.UserRole: lambda self, asset, column: asset.path,  # Asset path
+        Qt.UserRole + 1: lambda self, asset, column: asset.metadata,  # Metadata
+        Qt.ToolTipRole: lambda self, asset, column: _TOOLTIP_GETTERS[column](asset),
+        # Status column background color
+        Qt.BackgroundRole: lambda self, asset, column: (
+            self._get_status_background_color(asset.status) if column == 3 else None),
+        MULTIPLE_ROLES: lambda self, asset, column: self._paint_roles(asset, column),
+    }
     
     def __init__(self):
         super().__init__()
-        self.assets = []  # List of asset dictionaries
+        self.assets = []  # List of Asset rows
+        self._path_to_row = {}  # Asset path -> row in self.assets
         self.headers = ["Thumbnail", "Shot Names", "Frame Range", "Status", "Date Created"]
         self.sort_column = 0
         self.sort_order = Qt.AscendingOrder
@@ -67,53 +246,32 @@ class AssetTableModel(QAbstractTableModel):
         
         asset = self.assets[index.row()]
         column = index.column()
-        
+
+        # DisplayRole is the most frequent query, so it skips the role table
         if role == Qt.DisplayRole:
-            if column == 0:  # Thumbnail
-                return ""  # No text for thumbnail column
-            elif column == 1:  # Shot Name
-                return asset.get('shot_name', '')
-            elif column == 2:  # Frame Range
-                return asset.get('frame_range', '')
-            elif column == 3:  # Status
-                return asset.get('status', '')
-            elif column == 4:  # Date Created
-                return asset.get('date_created', '')
-        
-        elif role == Qt.DecorationRole:
-            if column == 0:  # Thumbnail
-                return asset.get('thumbnail_icon')
-        
-        elif role == Qt.SizeHintRole:
-            if column == 0:  # Thumbnail column
-                # Return the expected size for thumbnail icons
-                return QSize(self.thumbnail_size, self.thumbnail_size)
-        
-        elif role == Qt.UserRole:  # Store asset path
-            return asset.get('path')
-        
-        elif role == Qt.UserRole + 1:  # Store metadata
-            return asset.get('metadata', '')
-        
-        elif role == Qt.ToolTipRole:
-            if column == 0:  # Thumbnail tooltip
-                return f"File: {os.path.basename(asset.get('path', ''))}"
-            elif column == 1:  # Shot Name tooltip
-                return f"Shot: {asset.get('shot_name', 'Unknown')}"
-            elif column == 2:  # Frame Range tooltip
-                return f"Frame Range: {asset.get('frame_range', 'Unknown')}"
-            elif column == 3:  # Status tooltip
-                return f"Status: {asset.get('status', 'Unknown')} (Double-click to edit)"
-            elif column == 4:  # Date Created tooltip
-                return f"Created: {asset.get('date_created', 'Unknown')}"
-        
-        elif role == Qt.BackgroundRole:
-            if column == 3:  # Status column background color
-                status = asset.get('status', '')
-                return self._get_status_background_color(status)
-        
-        return None
+            return _DISPLAY_GETTERS[column](asset)
+        handler = self._ROLE_HANDLERS.get(role)
+        return handler(self, asset, column) if handler is not None else None
     
+    def _paint_roles(self, asset: Asset, column: int) -> Dict[int, Any]:
+        """Build every role SpeedUpDelegate needs to paint a cell in one pass."""
+        if column == 0:  # Thumbnail
+            return {
+                Qt.DisplayRole: "",
+                Qt.DecorationRole: asset.thumbnail_icon,
+                Qt.SizeHintRole: QSize(self.thumbnail_size, self.thumbnail_size),
+            }
+        if column == 1:
+            return {Qt.DisplayRole: asset.shot_name}
+        if column == 2:
+            return {Qt.DisplayRole: asset.frame_range}
+        if column == 3:
+            status = asset.status
+            return {Qt.DisplayRole: status, Qt.BackgroundRole: self._get_status_background_color(status)}
+        if column == 4:
+            return {Qt.DisplayRole: asset.date_created}
+        return {}
+
     def flags(self, index):
         """Return item flags for the given index."""
         if not index.isValid():
@@ -137,10 +295,10 @@ class AssetTableModel(QAbstractTableModel):
         
         if 0 <= row < len(self.assets):
             if column == 3:  # Status column
-                # Validate status value
-                valid_statuses = ["None", "WIP", "Review", "Approved"]
-                if value in valid_statuses:
-                    self.assets[row]['status'] = value
+                # Validate status value, keeping the shared status string
+                status = _STATUS_BY_NAME.get(value)
+                if status is not None:
+                    self.assets[row].status = status
                     self.dataChanged.emit(index, index)
                     return True
         
@@ -150,63 +308,103 @@ class AssetTableModel(QAbstractTableModel):
         """Sort the model by the given column and order."""
         self.sort_column = column
         self.sort_order = order
-        
-        def sort_key(asset):
-            if column == 0:  # Thumbnail - sort by filename
-                return os.path.basename(asset.get('path', ''))
-            elif column == 1:  # Shot Name
-                return asset.get('shot_name', '')
-            elif column == 2:  # Frame Range
-                # Sort by first frame number if available
-                frame_range = asset.get('frame_range', '')
-                match = re.search(r'(\d+)', frame_range)
-                return int(match.group(1)) if match else 0
-            elif column == 3:  # Status
-                return asset.get('status', '')
-            elif column == 4:  # Date Created
-                # Sort by actual file modification time
-                path = asset.get('path', '')
-                if os.path.exists(path):
-                    return os.path.getmtime(path)
-                return 0
-            return ''
-        
-        reverse = (order == Qt.DescendingOrder)
-        self.assets.sort(key=sort_key, reverse=reverse)
-        self.dataChanged.emit(self.index(0, 0), self.index(self.rowCount() - 1, self.columnCount() - 1))
+
+        keys = self._sort_keys(column)
+        if keys is None or len(keys) < 2:
+            return
+
+        # Stable argsort; for descending order sort the reversed keys so that
+        # equal keys keep their original relative order, like list.sort(reverse=True)
+        if order == Qt.DescendingOrder:
+            n = len(keys)
+            order_idx = (n - 1 - np.argsort(keys[::-1], kind='stable'))[::-1]
+        else:
+            order_idx = np.argsort(keys, kind='stable')
+
+        # A layout change rather than dataChanged over every cell: selections
+        # and other persistent indexes follow their rows to where they moved
+        self.layoutAboutToBeChanged.emit()
+        assets = self.assets
+        self.assets = [assets[i] for i in order_idx.tolist()]
+        self._rebuild_path_index()
+        new_rows = np.empty_like(order_idx)
+        new_rows[order_idx] = np.arange(len(order_idx))
+        old_indexes = self.persistentIndexList()
+        self.changePersistentIndexList(
+            old_indexes, [self.index(int(new_rows[i.row()]), i.column()) for i in old_indexes])
+        self.layoutChanged.emit()
     
-    def add_asset(self, asset_data: Dict[str, Any]):
+    def _sort_keys(self, column: int) -> Optional[np.ndarray]:
+        """Gather one column's sort key across all rows into an array."""
+        assets = self.assets
+        n = len(assets)
+        if column == 0:  # Thumbnail - sort by filename
+            return np.array([a.basename for a in assets], dtype=str)
+        elif column == 1:  # Shot Name
+            return np.array([a.shot_name for a in assets], dtype=str)
+        elif column == 2:  # Frame Range - first frame number, 0 if none
+            return np.fromiter((a.frame_first for a in assets), dtype=np.int64, count=n)
+        elif column == 3:  # Status
+            return np.array([a.status for a in assets], dtype=str)
+        elif column == 4:  # Date Created - file modification time captured at insert
+            return np.fromiter((a.mtime or 0.0 for a in assets), dtype=np.float64, count=n)
+        return None
+
+    def add_asset(self, asset_data: Asset):
         """Add an asset to the model."""
         self.beginInsertRows(QModelIndex(), len(self.assets), len(self.assets))
+        self._path_to_row[asset_data.path] = len(self.assets)
         self.assets.append(asset_data)
         self.endInsertRows()
     
+    def add_assets(self, assets: List[Asset]):
+        """Add several assets to the model with a single row insertion."""
+        if not assets:
+            return
+        first = len(self.assets)
+        self.beginInsertRows(QModelIndex(), first, first + len(assets) - 1)
+        for row, asset_data in enumerate(assets, first):
+            self._path_to_row[asset_data.path] = row
+        self.assets.extend(assets)
+        self.endInsertRows()
+    
     def clear_assets(self):
         """Clear all assets from the model."""
         self.beginResetModel()
         self.assets.clear()
+        self._path_to_row.clear()
         self.endResetModel()
+
+    def _rebuild_path_index(self):
+        """Recompute the path -> row index after rows are reordered."""
+        self._path_to_row = {asset.path: i for i, asset in enumerate(self.assets)}
     
-    def update_asset_thumbnail(self, path: str, thumbnail_icon: QIcon, metadata: str):
+    def update_asset_thumbnail(self, path: str, thumbnail_icon: QIcon, metadata: Optional[str]):
         """Update the thumbnail and metadata for a specific asset."""
-        for i, asset in enumerate(self.assets):
-            if asset.get('path') == path:
-                asset['thumbnail_icon'] = thumbnail_icon
-                asset['metadata'] = metadata
-
-                # Update frame range for videos based on metadata
-                if metadata and self._is_video_file(path):
-                    frame_count = self._extract_frame_count_from_metadata(metadata)
-                    if frame_count and frame_count > 0:
-                        asset['frame_range'] = f"1-{frame_count}"
-
-                index = self.index(i, 0)
-                self.dataChanged.emit(index, index)
-                # Also emit for frame range column if it was updated
-                frame_index = self.index(i, 2)
-                self.dataChanged.emit(frame_index, frame_index)
-                break
+        i = self._path_to_row.get(path)
+        if i is None:
+            return
+        asset = self.assets[i]
+        asset.thumbnail_icon = thumbnail_icon
+        asset.metadata = metadata
+
+        # Update frame range for videos based on metadata
+        if metadata and self._is_video_file(path):
+            frame_count = self._extract_frame_count_from_metadata(metadata)
+            if frame_count and frame_count > 0:
+                asset.frame_range = f"1-{frame_count}"
+                asset.frame_first = 1
+
+        # One signal covering thumbnail (0) through frame range (2), limited to
+        # the roles that can change here
+        self.dataChanged.emit(self.index(i, 0), self.index(i, 2),
+                              [Qt.DecorationRole, Qt.DisplayRole, Qt.ToolTipRole, Qt.UserRole + 1])
     
+    def set_asset_metadata(self, row: int, metadata: str):
+        """Store metadata that was loaded on demand for the asset at row."""
+        if 0 <= row < len(self.assets):
+            self.assets[row].metadata = metadata
+
     def _is_video_file(self, path: str) -> bool:
         """Check if the file is a video file."""
         return is_video(path)
@@ -217,8 +415,7 @@ class AssetTableModel(QAbstractTableModel):
             return None
         
         # Look for "Frames: {count}" pattern in metadata
-        import re
-        match = re.search(r'Frames:\s*(\d+)', metadata, re.IGNORECASE)
+        match = _FRAMES_RE.search(metadata)
         if match:
             try:
                 frame_count = int(match.group(1))
@@ -229,28 +426,63 @@ class AssetTableModel(QAbstractTableModel):
     
     def _get_status_background_color(self, status: str):
         """Get background color for status column based on status value."""
-        from PySide6.QtGui import QColor
-        
-        color_map = {
-            "None": QColor("#f0f0f0"),      # Light gray for no status
-            "WIP": QColor("#fff3cd"),       # Light yellow for work in progress
-            "Review": QColor("#d1ecf1"),    # Light blue for review
-            "Approved": QColor("#d4edda"),  # Light green for approved
-        }
-        
-        return color_map.get(status, QColor("#f0f0f0"))  # Default to light gray
+        return self._STATUS_COLORS.get(status, self._DEFAULT_STATUS_COLOR)
+
+
+class AssetInfoSignal(QObject):
+    """Signal emitter for asset info loading."""
+    done = Signal(int, object)  # load generation, List[Asset]
+
+
+class AssetInfoTask(QRunnable):
+    """Read the row fields of a batch of assets off the GUI thread.
+
+    The per-file stat and sequence scans fan out over the shared asset info
+    executor, since they spend their time in syscalls that release the GIL.
+    """
+
+    def __init__(self, read_fields, executor: ThreadPoolExecutor, paths: List[str], generation: int):
+        super().__init__()
+        self.signals = AssetInfoSignal()
+        self.read_fields = read_fields  # AssetListView._read_asset_fields
+        self.executor = executor
+        self.paths = paths
+        self.generation = generation  # Echoed back with the result
+
+    def run(self):
+        """Execute the asset info reads."""
+        _, video_mask = classify_paths(self.paths)
+        if len(self.paths) > 1:
+            assets = list(self.executor.map(self.read_fields, self.paths, video_mask))
+        else:
+            assets = [self.read_fields(path, video) for path, video in zip(self.paths, video_mask)]
+        self.signals.done.emit(self.generation, assets)
 
 
 class AssetListView(QTableView):
     """Custom table view for displaying assets in list format."""
+
+    _executor = None  # Shared ThreadPoolExecutor for add_assets
+    viewport_changed = Signal()  # Scrolled, resized or re-sorted; visible rows may need thumbnails
+    assets_loaded = Signal()  # An add_assets() batch is now in the model
     
     def __init__(self):
         super().__init__()
         self.model = AssetTableModel()
         self.setModel(self.model)
-        
-        # Set status delegate for column 3
+        # Asset info loads run here; one at a time keeps batches in call order
+        self._load_pool = QThreadPool(self)
+        self._load_pool.setMaxThreadCount(1)
+        self._load_gen = 0  # Bumped by clear_assets; loads started before are dropped
+        self._icon_cache = OrderedDict()  # (pixmap cacheKey, width, height) -> QIcon, LRU order
+        self._placeholder_icons = {}  # (width, height, color) -> shared QIcon
+        
+        # Paint cells from one multi-role fetch; status column 3 adds a combo box editor
+        self.speed_up_delegate = SpeedUpDelegate(self)
+        self.speed_up_delegate.set_model(self.model)
+        self.setItemDelegate(self.speed_up_delegate)
         self.status_delegate = StatusDelegate(self)
+        self.status_delegate.set_model(self.model)
         self.setItemDelegateForColumn(3, self.status_delegate)
         
         # Configure table appearance
@@ -266,7 +498,7 @@ class AssetListView(QTableView):
         header.setSectionResizeMode(0, QHeaderView.Interactive)  # Thumbnail column resizable from right
         header.setSectionResizeMode(1, QHeaderView.Stretch)  # Shot Name stretches to fill space
         header.setSectionResizeMode(2, QHeaderView.Interactive)  # Frame Range can be resized
-        header.setSectionResizeMode(3, QHeaderView.ResizeToContents)  # Status auto-size
+        header.setSectionResizeMode(3, QHeaderView.Fixed)  # Status strings are short; avoids per-change column scans
         header.setSectionResizeMode(4, QHeaderView.Fixed)  # Date Created not resizable
 
         # Set minimum column widths
@@ -278,7 +510,7 @@ class AssetListView(QTableView):
         self.setIconSize(QSize(self.thumbnail_size, self.thumbnail_size))
         self.setColumnWidth(0, self.thumbnail_size + 40)  # Thumbnail
         self.setColumnWidth(2, 90)   # Frame Range
-        self.setColumnWidth(3, 70)   # Status
+        self.setColumnWidth(3, 80)   # Status
         self.setColumnWidth(4, 120)  # Date Created
         row_height = max(40, self.thumbnail_size + 4)
         self.verticalHeader().setDefaultSectionSize(row_height)
@@ -318,6 +550,12 @@ class AssetListView(QTableView):
         # Enable context menu
         self.setContextMenuPolicy(Qt.CustomContextMenu)
         self.customContextMenuRequested.connect(self._show_context_menu)
+
+        # Rows arrive in scan order until the user picks a sort column
+        self._user_sorted = False
+        self.horizontalHeader().sortIndicatorChanged.connect(self._on_sort_indicator_changed)
+        self.horizontalHeader().sortIndicatorChanged.connect(self.viewport_changed)
+        self.verticalScrollBar().valueChanged.connect(self.viewport_changed)
         
     def set_thumbnail_size(self, size: int):
         """Set the thumbnail size and update row height accordingly. Always compact for list view."""
@@ -331,17 +569,92 @@ class AssetListView(QTableView):
         icon_height = row_height - 8
         self.setIconSize(QSize(icon_width, icon_height))
     
+    def showEvent(self, event):
+        """Report being shown; nothing is in view while the widget is hidden."""
+        super().showEvent(event)
+        self.viewport_changed.emit()
+
+    def resizeEvent(self, event):
+        """Report resizes, which can bring more rows into view."""
+        super().resizeEvent(event)
+        self.viewport_changed.emit()
+
+    def visible_paths(self, prefetch_rows: int = THUMB_PREFETCH_ROWS) -> List[str]:
+        """Get the paths of rows in the viewport, plus prefetch_rows rows either side."""
+        row_count = self.model.rowCount()
+        if row_count == 0 or not self.isVisible():
+            return []
+        first = self.rowAt(0)
+        last = self.rowAt(self.viewport().height() - 1)
+        if first < 0:
+            first = 0
+        if last < 0:
+            last = row_count - 1
+        first = max(0, first - prefetch_rows)
+        last = min(row_count - 1, last + prefetch_rows)
+        assets = self.model.assets
+        return [assets[row].path for row in range(first, last + 1)]
+
     def add_asset(self, path: str):
         """Add an asset to the list view."""
         # Extract asset information from file path
         asset_data = self._extract_asset_info(path)
         self.model.add_asset(asset_data)
+
+    def add_assets(self, paths: List[str]):
+        """Add several assets to the list view in one model insertion, without blocking.
+
+        The asset fields are read by an AssetInfoTask; its result is inserted
+        on the GUI thread by _on_assets_read, which then emits assets_loaded.
+        """
+        if not paths:
+            self.assets_loaded.emit()
+            return
+        task = AssetInfoTask(self._read_asset_fields, self._info_executor(), list(paths), self._load_gen)
+        task.signals.done.connect(self._on_assets_read)
+        self._load_pool.start(task)
+
+    def _on_assets_read(self, generation: int, assets: List[Asset]):
+        """Insert a finished batch of asset rows, unless the view was cleared since."""
+        if generation != self._load_gen:
+            return
+        placeholder = self._new_asset_placeholder()
+        for asset in assets:
+            asset.thumbnail_icon = placeholder
+        self.begin_bulk_load()
+        self.model.add_assets(assets)
+        self.end_bulk_load()
+        self.assets_loaded.emit()
+
+    @classmethod
+    def _info_executor(cls) -> ThreadPoolExecutor:
+        """Get the shared asset info thread pool, creating it on first use."""
+        if cls._executor is None:
+            cls._executor = ThreadPoolExecutor(max_workers=ASSET_INFO_WORKERS,
+                                               thread_name_prefix="asset-info")
+        return cls._executor
+
+    def begin_bulk_load(self):
+        """Suspend repaints while a directory's worth of assets is inserted."""
+        self.setUpdatesEnabled(False)
+
+    def end_bulk_load(self):
+        """Apply the user's sort column once to the loaded rows and resume repaints."""
+        if self._user_sorted:
+            header = self.horizontalHeader()
+            self.model.sort(header.sortIndicatorSection(), header.sortIndicatorOrder())
+        self.setUpdatesEnabled(True)
+
+    def _on_sort_indicator_changed(self, *args):
+        """Remember that the user chose a sort column, so reloads keep it."""
+        self._user_sorted = True
     
     def clear_assets(self):
-        """Clear all assets from the list view."""
+        """Clear all assets from the list view, dropping loads still running."""
+        self._load_gen += 1
         self.model.clear_assets()
     
-    def update_asset_thumbnail(self, path: str, pixmap: Optional[QPixmap], metadata: str):
+    def update_asset_thumbnail(self, path: str, pixmap: Optional[QPixmap], metadata: Optional[str]):
         """Update the thumbnail for a specific asset."""
         if pixmap:
             # Get the actual column width for thumbnail column (column 0)
@@ -351,84 +664,109 @@ class AssetListView(QTableView):
             # Keep height constrained to current row height minus padding
             max_height = self.verticalHeader().defaultSectionSize() - 8
             
-            # Scale to fit width first, then constrain height if needed
-            scaled_pixmap = pixmap.scaled(
-                column_width, max_height,
-                Qt.KeepAspectRatio, Qt.SmoothTransformation
-            )
-            icon = QIcon(scaled_pixmap)
+            icon = self._scaled_icon(pixmap, column_width, max_height)
         else:
             # Create placeholder icon using column width
             column_width = self.columnWidth(0) - 8
             max_height = self.verticalHeader().defaultSectionSize() - 8
-            placeholder = QPixmap(column_width, max_height)
-            placeholder.fill(Qt.darkGray)
-            icon = QIcon(placeholder)
+            icon = self._placeholder_icon(column_width, max_height, Qt.darkGray)
         
         self.model.update_asset_thumbnail(path, icon, metadata)
+
+    def _placeholder_icon(self, width: int, height: int, color) -> QIcon:
+        """Get the shared solid-color placeholder icon for the given size."""
+        key = (width, height, color)
+        icon = self._placeholder_icons.get(key)
+        if icon is None:
+            icon = self._placeholder_icons[key] = QIcon(ImageProcessor.placeholder_pixmap(width, height, color))
+        return icon
+
+    def _scaled_icon(self, pixmap: QPixmap, width: int, height: int) -> QIcon:
+        """Get pixmap scaled to fit width x height as an icon, reusing earlier scalings.
+
+        Thumbnails served from the in-memory cache are the same QPixmap on every
+        refresh, so their cacheKey() identifies the scaled result.
+        """
+        key = (pixmap.cacheKey(), width, height)
+        icon = self._icon_cache.get(key)
+        if icon is not None:
+            self._icon_cache.move_to_end(key)
+            return icon
+        # Scale to fit width first, then constrain height if needed
+        scaled_pixmap = pixmap.scaled(
+            width, height,
+            Qt.KeepAspectRatio, Qt.SmoothTransformation
+        )
+        icon = QIcon(scaled_pixmap)
+        self._icon_cache[key] = icon
+        if len(self._icon_cache) > LIST_ICON_CACHE_SIZE:
+            self._icon_cache.popitem(last=False)
+        return icon
     
-    def _extract_asset_info(self, path: str) -> Dict[str, Any]:
+    def _extract_asset_info(self, path: str) -> Asset:
         """Extract asset information from file path."""
+        asset = self._read_asset_fields(path)
+        asset.thumbnail_icon = self._new_asset_placeholder()
+        return asset
+
+    def _new_asset_placeholder(self) -> QIcon:
+        """Placeholder icon for rows whose thumbnail has not arrived yet."""
+        # Create placeholder thumbnail using column width
+        column_width = self.columnWidth(0) - 8 if hasattr(self, 'columnWidth') else self.thumbnail_size + 32
+        max_height = self.verticalHeader().defaultSectionSize() - 8 if hasattr(self, 'verticalHeader') else self.thumbnail_size + 4
+        return self._placeholder_icon(column_width, max_height, Qt.black)
+
+    def _read_asset_fields(self, path: str, video: Optional[bool] = None) -> Asset:
+        """Build an asset row from its file path, without a thumbnail icon.
+
+        Only touches the filesystem and plain Python state, so it is safe to run
+        on worker threads. video is the path's classify_paths() result, if known.
+        """
         filename = os.path.basename(path)
+        name_no_ext = os.path.splitext(filename)[0]
         
         # Extract shot name (everything before frame numbers or extension)
         shot_name = self._extract_shot_name(filename)
         
         # Extract frame range
-        frame_range = self._extract_frame_range(filename)
+        frame_range = self._extract_frame_range(path, video)
         
         # Determine status (this could be enhanced with more sophisticated logic)
         status = self._determine_status(path, filename)
         
-        # Get creation date
-        date_created = self._get_date_created(path)
-        
-        # Create placeholder thumbnail using column width
-        column_width = self.columnWidth(0) - 8 if hasattr(self, 'columnWidth') else self.thumbnail_size + 32
-        max_height = self.verticalHeader().defaultSectionSize() - 8 if hasattr(self, 'verticalHeader') else self.thumbnail_size + 4
-        placeholder = QPixmap(column_width, max_height)
-        placeholder.fill(Qt.black)
-        
-        return {
-            'path': path,
-            'shot_name': shot_name,
-            'frame_range': frame_range,
-            'status': status,
-            'date_created': date_created,
-            'thumbnail_icon': QIcon(placeholder),
-            'metadata': ''
-        }
+        # Get creation date, keeping the raw mtime for sorting
+        try:
+            mtime = os.path.getmtime(path)
+        except OSError:
+            mtime = None
+        date_created = self._get_date_created(mtime)
+        
+        return Asset(
+            path=path,
+            basename=filename,
+            name_no_ext=name_no_ext,
+            shot_name=shot_name,
+            frame_range=frame_range,
+            status=status,
+            date_created=date_created,
+            mtime=mtime,
+            thumbnail_icon=None,
+            metadata=None,  # Read when the row is first selected
+        )
     
     def _extract_shot_name(self, filename: str) -> str:
         """Extract shot name from filename."""
         # Remove extension
         name_without_ext = os.path.splitext(filename)[0]
         
-        # Common patterns for shot names:
-        patterns = [
-            # Pattern for Shot00001, Shot_001, etc.
-            r'^(Shot[_\-]?\d+)',
-            # Pattern for shot001, shot_001, etc.
-            r'^(shot[_\-]?\d+)',
-            # Pattern for any word followed by numbers (like render001, comp001)
-            r'^([a-zA-Z]+\d+)',
-            # Pattern for complex shot names like Shot_01_comp_v001
-            r'^([^_\.]+_\d+)',
-            # Pattern for sequence names like seq01_shot01
-            r'^(seq\d+[_\-]shot\d+)',
-            # General pattern: everything before version numbers or large frame sequences
-            r'^([^\.]+?)(?:_v\d+|_\d{4,}|\.\d{4,}|_version\d+)?$',
-        ]
-        
-        for pattern in patterns:
-            match = re.match(pattern, name_without_ext, re.IGNORECASE)
-            if match:
-                shot_name = match.group(1)
-                # Clean up shot name - normalize separators
-                shot_name = re.sub(r'[_\-]+', '_', shot_name)
-                # Remove trailing underscores
-                shot_name = shot_name.rstrip('_')
-                return shot_name
+        match = _SHOT_NAME_RE.match(name_without_ext)
+        if match:
+            shot_name = match.group(match.lastgroup)
+            # Clean up shot name - normalize separators
+            shot_name = _SEPARATORS_RE.sub('_', shot_name)
+            # Remove trailing underscores
+            shot_name = shot_name.rstrip('_')
+            return shot_name
         
         # Fallback: use filename without extension, but truncate if too long
         result = name_without_ext
@@ -436,39 +774,36 @@ class AssetListView(QTableView):
             result = result[:17] + "..."
         return result
     
-    def _extract_frame_range(self, filename: str) -> str:
-        """Extract frame range from filename."""
+    def _extract_frame_range(self, path: str, video: Optional[bool] = None) -> str:
+        """Extract frame range from an asset path, scanning its folder for a sequence."""
+        directory, filename = os.path.split(path)
         # Remove extension
         name_without_ext = os.path.splitext(filename)[0]
         
         # Look for frame number patterns
-        patterns = [
-            r'\.(\d{4,})$',  # .1001, .1002, etc.
-            r'_(\d{4,})$',   # _1001, _1002, etc.
-            r'(\d{4,})$',    # 1001, 1002, etc.
-        ]
-        
         frame_num = None
-        for pattern in patterns:
-            match = re.search(pattern, name_without_ext)
+        for pattern in _FRAME_TAIL_PATTERNS:
+            match = pattern.search(name_without_ext)
             if match:
                 frame_num = match.group(1)
                 break
         
         if frame_num:
             # Try to detect frame range by scanning directory
-            directory = os.path.dirname(filename) if os.path.dirname(filename) else '.'
-            if os.path.exists(directory):
-                try:
-                    frame_range = self._scan_frame_range(directory, name_without_ext, frame_num)
-                    if frame_range:
-                        return frame_range
-                except:
-                    pass
+            # (_scan_frame_range handles a missing directory, so no exists() probe)
+            directory = directory or '.'
+            try:
+                frame_range = self._scan_frame_range(directory, name_without_ext, frame_num)
+                if frame_range:
+                    return frame_range
+            except:
+                pass
             return f"{frame_num}"
         
         # Check if it's a video file (single frame range)
-        if is_video(filename):
+        if video is None:
+            video = is_video(filename)
+        if video:
             # For videos, we'll initially show "Video" but it will be updated
             # with actual frame count when metadata becomes available
             return "Video"
@@ -478,32 +813,46 @@ class AssetListView(QTableView):
     def _scan_frame_range(self, directory: str, base_name: str, current_frame: str) -> str:
         """Scan directory to find frame range for sequence."""
         try:
-            # Extract the base name without frame number
-            frame_pattern = current_frame
-            base_pattern = base_name.replace(frame_pattern, '')
+            # The frame number ends base_name, so sibling frames share everything
+            # before it and carry their digits at the same offset
+            base_pattern = base_name[:-len(current_frame)]
+            start = len(base_pattern)
+            end = start + len(current_frame)
             
             # Find all files with similar pattern
-            frames = []
-            for file in os.listdir(directory):
-                if file.startswith(base_pattern):
-                    # Extract frame number from similar files
-                    match = re.search(r'(\d{4,})', file)
-                    if match:
-                        try:
-                            frames.append(int(match.group(1)))
-                        except ValueError:
-                            continue
+            frame_digits = []
+            with os.scandir(directory) as it:
+                for entry in it:
+                    name = entry.name
+                    if not name.startswith(base_pattern):
+                        continue
+                    digits = name[start:end]
+                    # Skip names where the frame is shorter or longer than ours
+                    if not (digits.isascii() and digits.isdigit()) or name[end:end + 1].isdigit():
+                        continue
+                    frame_digits.append(digits)
             
-            if len(frames) > 1:
-                frames.sort()
-                return f"{frames[0]}-{frames[-1]}"
-            elif len(frames) == 1:
-                return str(frames[0])
-        except:
+            if len(frame_digits) > 1:
+                first, last = self._frame_digits_min_max(frame_digits, len(current_frame))
+                return f"{first}-{last}"
+            elif len(frame_digits) == 1:
+                return str(int(frame_digits[0]))
+        except OSError:
             pass
         
         return current_frame
     
+    @staticmethod
+    def _frame_digits_min_max(frame_digits: List[str], width: int) -> Tuple[int, int]:
+        """Min and max of equal-width ASCII digit strings, parsed in one vectorized pass."""
+        if width > 18:  # Beyond int64 range; digit strings of equal width still sort numerically
+            return int(min(frame_digits)), int(max(frame_digits))
+        digits = np.frombuffer("".join(frame_digits).encode("ascii"), dtype=np.uint8)
+        digits = digits.reshape(len(frame_digits), width) - ord("0")
+        place_values = 10 ** np.arange(width - 1, -1, -1, dtype=np.int64)
+        frames = digits @ place_values
+        return int(frames.min()), int(frames.max())
+
     def _determine_status(self, path: str, filename: str) -> str:
         """Determine asset status - defaults to None for user control."""
         # Default to None - user will set status manually
@@ -525,27 +874,26 @@ class AssetListView(QTableView):
         status_menu = menu.addMenu("Set Status")
         
         # Status options
-        status_options = ["None", "WIP", "Review", "Approved"]
-        for status in status_options:
+        for status in _STATUS_OPTIONS:
             action = status_menu.addAction(status)
-            action.triggered.connect(lambda checked, s=status: self._set_asset_status(index.row(), s))
+            action.triggered.connect(partial(self._set_asset_status, index.row(), status))
         
         # Show the menu
         menu.exec(self.mapToGlobal(position))
     
-    def _set_asset_status(self, row: int, status: str):
-        """Set the status for the asset at the given row."""
+    def _set_asset_status(self, row: int, status: str, *_):
+        """Set the status for the asset at the given row (extra signal args are ignored)."""
         if 0 <= row < len(self.model.assets):
-            self.model.assets[row]['status'] = status
+            self.model.assets[row].status = status
             # Emit data changed signal for the status column
             index = self.model.index(row, 3)  # Status column is index 3
             self.model.dataChanged.emit(index, index)
     
-    def _get_date_created(self, path: str) -> str:
-        """Get formatted creation date."""
+    def _get_date_created(self, mtime: Optional[float]) -> str:
+        """Get formatted creation date from a modification time."""
+        if mtime is None:
+            return "Unknown"
         try:
-            mtime = os.path.getmtime(path)
-            date = datetime.fromtimestamp(mtime)
-            return date.strftime("%d/%m/%Y")
-        except:
+            return datetime.fromtimestamp(mtime).strftime("%d/%m/%Y")
+        except (OverflowError, OSError, ValueError):
             return "Unknown"
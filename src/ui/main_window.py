@@ -4,9 +4,11 @@ Main window for the Asset Browser application.
 
 import os
 import re
-import shutil
+import threading
+from collections import OrderedDict
 from typing import List, Optional
-from PySide6.QtCore import Qt, QDir, QUrl, QThreadPool, QSize
+import numpy as np
+from PySide6.QtCore import Qt, QDir, QUrl, QThreadPool, QSize, QTimer
 from PySide6.QtGui import QAction, QIcon, QPixmap, QDesktopServices
 from PySide6.QtWidgets import (
     QMainWindow, QFileDialog, QToolBar, QWidget, QVBoxLayout, QHBoxLayout,
@@ -20,13 +22,54 @@ from .list_view import AssetListView
 from .preview_pane import PreviewPane
 from .settings_dialog import SettingsDialog
 from ..config.config_manager import ConfigManager
-from ..thumbnail.cache import CacheManager
-from ..thumbnail.thumb_task import ThumbTask
-from ..utils.file_utils import is_supported_asset
+from ..thumbnail.cache import CacheManager, PIXMAP_CACHE
+from ..thumbnail.scheduler import ThumbScheduler
+from ..thumbnail.clear_cache_task import ClearCacheTask
+from ..thumbnail.image_processor import ImageProcessor
+from ..utils.file_utils import is_supported_asset_by_name
 from ..utils.logging_config import LOGGER
 from ..config import constants
 
 
+_SHORTCUTS_HTML = """
+<h3>Keyboard Shortcuts</h3>
+<table>
+<tr><td><b>Ctrl+N</b></td><td>New Project</td></tr>
+<tr><td><b>Ctrl+O</b></td><td>Open Folder</td></tr>
+<tr><td><b>Ctrl+F</b></td><td>Focus Search Field</td></tr>
+<tr><td><b>Ctrl+,</b></td><td>Open Settings</td></tr>
+<tr><td><b>F5</b></td><td>Refresh View</td></tr>
+<tr><td><b>F1</b></td><td>Show Shortcuts</td></tr>
+<tr><td><b>Ctrl+Q</b></td><td>Exit Application</td></tr>
+<tr><td><b>Double-click</b></td><td>Open File</td></tr>
+</table>
+"""
+
+_ABOUT_HTML = """
+<h2>Asset Browser</h2>
+<p><b>Version:</b> 1.0</p>
+<p><b>Description:</b> A standalone asset browser built with Python, OpenCV, OpenImageIO, and PySide6</p>
+
+<h3>Features:</h3>
+<ul>
+<li>Browse folders and view thumbnails in a grid</li>
+<li>Support for many image formats (including EXR, TIFF, HDR)</li>
+<li>Video thumbnail support (first frame)</li>
+<li>Search filtering with regex support</li>
+<li>Adjustable thumbnail size</li>
+<li>Preview pane with metadata</li>
+<li>Disk thumbnail cache</li>
+<li>Light/dark theme awareness</li>
+</ul>
+
+<h3>Supported Formats:</h3>
+<p><b>Images:</b> JPG, PNG, BMP, TIFF, GIF, EXR, HDR, DPX, PSD, SVG, JP2</p>
+<p><b>Videos:</b> MP4, MOV, AVI, MKV, WEBM</p>
+
+<p><b>Built with:</b> Python 3.10+, PySide6, OpenCV, OpenImageIO</p>
+"""
+
+
 class MainWindow(QMainWindow):
     """Main window for the Asset Browser application."""
     
@@ -42,8 +85,50 @@ class MainWindow(QMainWindow):
         # Initialize project management
         self.projects_list = self.settings.get('projects', [])
         
+        # Thumbnail decodes are CPU bound and run on the global pool, sized by
+        # the thread_count setting; cache probes are I/O bound and get a wider pool
         self.thread_pool = QThreadPool.globalInstance()
-        self.thumb_px = self.settings['thumb_size']
+        self.io_pool = QThreadPool(self)
+        self.io_pool.setMaxThreadCount(max(constants.IO_THREADS_MIN, 2 * (os.cpu_count() or 1)))
+        # Cache clearing gets its own pool: refreshes clear() the global one,
+        # which would silently drop a queued clear
+        self.cache_pool = QThreadPool(self)
+        self.cache_pool.setMaxThreadCount(1)
+        self._clearing_cache_root = ""  # Folder of the current folder clear, for its error message
+
+        # Each refresh starts a new thumbnail generation; tasks from older ones
+        # stop early and their results are dropped
+        self._refresh_gen = 0
+        self._thumb_cancel = threading.Event()
+        # Thumbnails are requested as items scroll into view
+        self._thumb_scheduler = ThumbScheduler(self.thread_pool, self.io_pool, self)
+        self._thumb_scheduler.batch_size = self.settings['thumb_batch_size']
+        self._thumb_scheduling = False  # Set once the current refresh has items to schedule
+        self._pending_list_load = None  # (generation, entries, cache_root, cache_hashes) awaiting list rows
+        self._path_to_item = {}  # Grid item for each asset path in the current refresh
+        self._placeholder_icons = {}  # (width, height, color) -> shared grid placeholder QIcon
+        self._cache_root_memo = {}  # (project, folder) -> cache root
+        self._shortcuts_msg = None  # Help message boxes, created when first shown
+        self._about_msg = None
+        self._set_thumb_px(self.settings['thumb_size'])
+
+        # Search filter compiled once per query: a regex, or a lowercase
+        # substring when the text is not a valid pattern
+        self._search_text = ""
+        self._search_rx: Optional[re.Pattern] = None
+        self._search_lower: Optional[str] = None
+        # Search refreshes reuse the folder's listing, and the results of
+        # queries seen since it was read (backspacing to an earlier query)
+        self._listing_dir: Optional[str] = None
+        self._listing: List[os.DirEntry] = []  # Supported assets in _listing_dir, newest first
+        self._query_cache = OrderedDict()  # Search text -> filtered _listing, LRU order
+
+        # UI toggles mark settings dirty; one write follows once they settle
+        self._settings_dirty = False
+        self._settings_save_timer = QTimer(self)
+        self._settings_save_timer.setSingleShot(True)
+        self._settings_save_timer.setInterval(constants.SETTINGS_SAVE_DELAY_MS)
+        self._settings_save_timer.timeout.connect(self._flush_settings)
 
         self.current_project = None
         self.current_dir = start_dir or QDir.homePath()
@@ -54,6 +139,9 @@ class MainWindow(QMainWindow):
         # Apply thread count setting
         self.thread_pool.setMaxThreadCount(self.settings['thread_count'])
 
+        # Size the in-memory thumbnail cache from the cache size setting
+        PIXMAP_CACHE.set_max_items(self.settings['max_cache_size'] * constants.PIXMAP_CACHE_ITEMS_PER_MB)
+
         self._setup_ui()
         self._apply_startup_settings()
         self._refresh_thumbs()
@@ -61,25 +149,35 @@ class MainWindow(QMainWindow):
     def _setup_ui(self):
         """Setup the main window UI."""
         # Setup file system model
+        # Directories only, without watching them for changes or probing
+        # each one for a custom icon; keeps large trees cheap to populate
         self.fs_model = QFileSystemModel()
+        self.fs_model.setOption(QFileSystemModel.DontWatchForChanges, True)
+        self.fs_model.setOption(QFileSystemModel.DontUseCustomDirectoryIcons, True)
         self.fs_model.setRootPath("")
-        self.fs_model.setFilter(QDir.AllDirs | QDir.NoDotAndDotDot)
+        self.fs_model.setFilter(QDir.AllDirs | QDir.NoDotAndDotDot | QDir.NoSymLinks)
         
         # Setup tree view
         self.tree = QTreeView()
+        self.tree.setUniformRowHeights(True)
+        self.tree.setAnimated(False)
         self.tree.setModel(self.fs_model)
-        self.tree.setRootIndex(self.fs_model.index(self.current_dir))
+        self._tree_root_path = None
+        self._set_tree_root(self.current_dir)
         self.tree.clicked.connect(self._on_tree_clicked)
 
         # Setup thumbnail list (grid view)
         self.list = ThumbList()
         self.list.itemSelectionChanged.connect(self._on_selection_changed)
         self.list.itemDoubleClicked.connect(self._open_selected)
+        self.list.viewport_changed.connect(self._schedule_visible_thumbs)
 
         # Setup asset list view (list view)
         self.asset_list_view = AssetListView()
         self.asset_list_view.selectionModel().selectionChanged.connect(self._on_list_selection_changed)
         self.asset_list_view.doubleClicked.connect(self._on_list_double_clicked)
+        self.asset_list_view.viewport_changed.connect(self._schedule_visible_thumbs)
+        self.asset_list_view.assets_loaded.connect(self._on_list_assets_loaded)
 
         # Create stacked widget to switch between views
         self.view_stack = QStackedWidget()
@@ -131,7 +229,12 @@ class MainWindow(QMainWindow):
         tb.addWidget(QLabel("Search:"))
         self.search = QLineEdit()
         self.search.setPlaceholderText("Filter by filename (regex ok)")
-        self.search.textChanged.connect(self._refresh_thumbs)
+        # Restartable single-shot timer: only the last keystroke of a burst refreshes
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(constants.SEARCH_DEBOUNCE_MS)
+        self._search_timer.timeout.connect(self._on_search_changed)
+        self.search.textChanged.connect(self._search_timer.start)
         tb.addWidget(self.search)
 
         tb.addSeparator()
@@ -358,6 +461,13 @@ class MainWindow(QMainWindow):
             project_name = os.path.basename(project_path)
             self.project_combo.addItem(project_name, project_path)
 
+    def _set_tree_root(self, path: str):
+        """Root the folder tree at path, unless it is already rooted there."""
+        if path == self._tree_root_path:
+            return
+        self.tree.setRootIndex(self.fs_model.index(path))
+        self._tree_root_path = path
+
     def _on_tree_clicked(self, index):
         """Handle tree view item clicks."""
         path = self.fs_model.filePath(index)
@@ -382,7 +492,7 @@ class MainWindow(QMainWindow):
                         break
         
         # Update tree view and refresh
-        self.tree.setRootIndex(self.fs_model.index(self.current_dir))
+        self._set_tree_root(self.current_dir)
         self._refresh_thumbs()
 
     def _set_view_mode(self, mode: str):
@@ -407,7 +517,7 @@ class MainWindow(QMainWindow):
         
         # Save view mode to settings
         self.settings['view_mode'] = mode
-        self.config_manager.save_settings(self.settings)
+        self._queue_settings_save()
         
         # Refresh current view
         self._refresh_thumbs()
@@ -423,15 +533,16 @@ class MainWindow(QMainWindow):
         index = indexes[0]
         path = self.asset_list_view.model.data(index, Qt.UserRole)
         metadata = self.asset_list_view.model.data(index, Qt.UserRole + 1)
-        
-        # Get thumbnail from the model
-        thumbnail_icon = self.asset_list_view.model.data(self.asset_list_view.model.index(index.row(), 0), Qt.DecorationRole)
-        if thumbnail_icon:
-            pixmap = thumbnail_icon.pixmap(self.thumb_px, self.thumb_px)
-            self.preview.show_preview(pixmap)
-        else:
-            self.preview.show_preview(None)
-        
+        if metadata is None and path:
+            metadata = ImageProcessor.read_metadata(path)
+            self.asset_list_view.model.set_asset_metadata(index.row(), metadata)
+        
+        # Preview the full-size thumbnail rather than re-rastering the row icon
+        pixmap = self._cached_thumbnail(path) if path else None
+        if pixmap is None:
+            icon = self.asset_list_view.model.data(index.siblingAtColumn(0), Qt.DecorationRole)
+            pixmap = icon.pixmap(self.asset_list_view.iconSize()) if icon is not None else None
+        self.preview.show_preview(pixmap)
         self.preview.set_metadata(metadata or "")
 
     def _on_list_double_clicked(self, index):
@@ -442,12 +553,22 @@ class MainWindow(QMainWindow):
 
     def _on_size_changed(self, v: int):
         """Handle thumbnail size slider changes."""
-        self.thumb_px = int(v)
+        self._set_thumb_px(v)
         if self.view_mode == 'grid':
             self.list.set_thumb_size(self.thumb_px)
+            self._resize_grid_items()
         else:
             self.asset_list_view.set_thumbnail_size(self.thumb_px)
 
+    def _cached_thumbnail(self, path: str) -> Optional[QPixmap]:
+        """Get the canonical thumbnail of path from the in-memory cache, if still there."""
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        cached = PIXMAP_CACHE.get(PIXMAP_CACHE.key_for(path, st))
+        return cached[0] if cached is not None else None
+
     def _on_selection_changed(self):
         """Handle thumbnail list selection changes."""
         items = self.list.selectedItems()
@@ -456,9 +577,21 @@ class MainWindow(QMainWindow):
             self.preview.set_metadata("")
             return
         item = items[0]
-        pix = item.icon().pixmap(self.thumb_px, self.thumb_px)
+        # Thumbnail icons hold the canonical-size pixmap; asking for that size returns it unscaled
+        pix = item.icon().pixmap(QSize(constants.THUMB_CANONICAL_SIZE, constants.THUMB_CANONICAL_SIZE))
         self.preview.show_preview(pix)
-        self.preview.set_metadata(item.data(Qt.UserRole) or "")
+        self.preview.set_metadata(self._item_metadata(item))
+
+    def _item_metadata(self, item: QListWidgetItem) -> str:
+        """Get metadata for a grid item, reading it on first use if it was deferred."""
+        meta = item.data(Qt.UserRole)
+        if meta is None:
+            path = item.data(Qt.UserRole + 1)
+            if not path:
+                return ""
+            meta = ImageProcessor.read_metadata(path)
+            item.setData(Qt.UserRole, meta)
+        return meta
 
     def _open_selected(self, item: QListWidgetItem):
         """Open selected item with system default application."""
@@ -475,7 +608,7 @@ class MainWindow(QMainWindow):
                                   "Selected folder is outside the current project.")
                 return
             self.current_dir = dir_
-            self.tree.setRootIndex(self.fs_model.index(self.current_dir))
+            self._set_tree_root(self.current_dir)
             self._refresh_thumbs()
 
     def _new_project(self):
@@ -497,81 +630,179 @@ class MainWindow(QMainWindow):
                 QMessageBox.information(self, "Project Exists", 
                                       "This project is already in the list.")
 
-    def _list_assets(self) -> List[str]:
-        """List all supported assets in the current directory."""
-        root = self.current_dir
-        if not os.path.isdir(root):
+    def _scan_assets(self, reuse_listing: bool = False) -> List[os.DirEntry]:
+        """Get the supported assets in the current directory matching the search, newest first.
+
+        The directory is read again unless reuse_listing is set, which search
+        refreshes do: the folder's contents are the same, only the query changed.
+        """
+        if self.search.text().strip() != self._search_text:
+            self._update_search_filter()
+        if not reuse_listing or self._listing_dir != self.current_dir:
+            self._listing = self._list_assets(self.current_dir)
+            self._listing_dir = self.current_dir
+            self._query_cache.clear()
+
+        query = self._search_text
+        entries = self._query_cache.get(query)
+        if entries is not None:
+            self._query_cache.move_to_end(query)
+            return entries
+        entries = self._filter_assets(self._listing)
+        self._query_cache[query] = entries
+        if len(self._query_cache) > constants.SEARCH_CACHE_SIZE:
+            self._query_cache.popitem(last=False)
+        return entries
+
+    def _list_assets(self, folder: str) -> List[os.DirEntry]:
+        """Scan folder for supported assets, returning scandir entries, newest first."""
+        entries = []
+        mtimes = []
+        try:
+            with os.scandir(folder) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False) or not is_supported_asset_by_name(entry.name):
+                        continue
+                    try:
+                        # The stat is also cached on the entry for the cache keys
+                        mtimes.append(entry.stat().st_mtime)
+                    except OSError:
+                        continue  # Removed or unreadable since the directory was read
+                    entries.append(entry)
+        except OSError as e:
+            LOGGER.warning(f"Cannot list directory {folder}: {e}")
             return []
-        names = []
-        for name in os.listdir(root):
-            p = os.path.join(root, name)
-            if os.path.isdir(p):
-                continue
-            if is_supported_asset(p):
-                names.append(p)
-        
-        # Apply search filter
+
+        # Sort by modification time (newest first); a stable argsort keeps
+        # scandir order among equal times, as list.sort(reverse=True) did
+        order = np.argsort(-np.array(mtimes, dtype=np.float64), kind='stable')
+        return [entries[i] for i in order.tolist()]
+
+    def _filter_assets(self, entries: List[os.DirEntry]) -> List[os.DirEntry]:
+        """Get the entries whose names match the compiled search filter, in order."""
+        rx = self._search_rx
+        if rx is not None:
+            search = rx.search
+            return [e for e in entries if search(e.name)]
+        ql = self._search_lower
+        if ql:
+            return [e for e in entries if ql in e.name.lower()]
+        return entries
+
+    def _update_search_filter(self):
+        """Compile the search box text into the filter used by _scan_assets."""
         q = self.search.text().strip()
-        if q:
-            try:
-                rx = re.compile(q, re.IGNORECASE)
-                names = [n for n in names if rx.search(os.path.basename(n))]
-            except Exception:
-                ql = q.lower()
-                names = [n for n in names if ql in os.path.basename(n).lower()]
-        
-        # Sort by modification time (newest first)
-        names.sort(key=lambda p: os.path.getmtime(p), reverse=True)
-        return names
+        self._search_text = q
+        self._search_rx = None
+        self._search_lower = None
+        if not q:
+            return
+        try:
+            self._search_rx = re.compile(q, re.IGNORECASE)
+        except re.error:
+            self._search_lower = q.lower()
+
+    def _on_search_changed(self):
+        """Apply the search text once typing has paused."""
+        self._update_search_filter()
+        self._refresh_thumbs(reuse_listing=True)
 
     def _cache_root_for_dir(self, folder: str) -> str:
         """Get cache root directory for the given folder."""
-        return CacheManager.generate_cache_root(self.current_project, folder)
+        key = (self.current_project or "", folder)
+        cache_root = self._cache_root_memo.get(key)
+        if cache_root is None:
+            cache_root = CacheManager.generate_cache_root(self.current_project, folder)
+            self._cache_root_memo[key] = cache_root
+        return cache_root
+
+    def _cancel_thumb_work(self):
+        """Drop queued thumbnail tasks, stop running ones and ignore their results."""
+        self._refresh_gen += 1
+        self._thumb_cancel.set()
+        self._thumb_cancel = threading.Event()
+        self.thread_pool.clear()
+        self._thumb_scheduling = False
 
-    def _refresh_thumbs(self):
-        """Refresh the thumbnail list."""
+    def _refresh_thumbs(self, reuse_listing: bool = False):
+        """Refresh the thumbnail list.
+
+        reuse_listing keeps the last read of the directory; see _scan_assets.
+        """
+        # Cancel the previous refresh before starting this one
+        self._cancel_thumb_work()
         if self.view_mode == 'grid':
-            self._refresh_grid_view()
+            self._refresh_grid_view(reuse_listing)
         else:
-            self._refresh_list_view()
+            self._refresh_list_view(reuse_listing)
     
-    def _refresh_grid_view(self):
+    def _refresh_grid_view(self, reuse_listing: bool = False):
         """Refresh the grid view."""
         self.list.clear()
-        assets = self._list_assets()
+        self._path_to_item.clear()
+        entries = self._scan_assets(reuse_listing)
+        assets = [e.path for e in entries]
+        cache_hashes = CacheManager.batch_hash(entries)
         LOGGER.info(f"Refresh grid view: dir={self.current_dir}, count={len(assets)}")
         cache_root = self._cache_root_for_dir(self.current_dir)
         
+        # Suspend repaints while populating; the list lays items out once afterwards
+        self.list.setUpdatesEnabled(False)
         for path in assets:
-            LOGGER.debug(f"Schedule thumbnail: {path}")
+            LOGGER.debug("Add grid item: %s", path)
             item = QListWidgetItem(os.path.basename(path))
-            # Set item size to match 16:9 aspect ratio with some padding
-            thumb_height = int(self.thumb_px * 9 / 16)
-            item.setSizeHint(QSize(self.thumb_px + 16, thumb_height + 36))
+            item.setSizeHint(self._item_size_hint)
             item.setData(Qt.UserRole + 1, path)
-            placeholder = QPixmap(self.thumb_px, thumb_height)
-            placeholder.fill(Qt.black)
-            item.setIcon(QIcon(placeholder))
+            item.setIcon(self._loading_icon)
             self.list.addItem(item)
+            self._path_to_item[path] = item
+        self.list.setUpdatesEnabled(True)
+
+        self._start_thumb_scheduling(entries, cache_root, cache_hashes, self._on_thumbs_ready)
+
+    def _start_thumb_scheduling(self, entries: List[os.DirEntry], cache_root: str, cache_hashes, on_done):
+        """Point the thumbnail scheduler at this refresh and request the items in view."""
+        file_stats = {e.path: e.stat() for e in entries}
+        self._thumb_scheduler.reset(cache_root, cache_hashes, file_stats,
+                                    self._refresh_gen, self._thumb_cancel, on_done)
+        self._thumb_scheduling = True
+        self._schedule_visible_thumbs()
 
-            task = ThumbTask(path, self.thumb_px, cache_root)
-            task.signals.done.connect(self._on_thumb_ready)
-            self.thread_pool.start(task)
+    def _schedule_visible_thumbs(self):
+        """Reprioritize thumbnail work around the items now in view."""
+        if not self._thumb_scheduling:
+            return
+        view = self.list if self.view_mode == 'grid' else self.asset_list_view
+        self._thumb_scheduler.request(view.visible_paths(0), view.visible_paths())
     
-    def _refresh_list_view(self):
+    def _refresh_list_view(self, reuse_listing: bool = False):
         """Refresh the list view."""
         self.asset_list_view.clear_assets()
-        assets = self._list_assets()
+        entries = self._scan_assets(reuse_listing)
+        assets = [e.path for e in entries]
+        cache_hashes = CacheManager.batch_hash(entries)
         LOGGER.info(f"Refresh list view: dir={self.current_dir}, count={len(assets)}")
         cache_root = self._cache_root_for_dir(self.current_dir)
         
-        for path in assets:
-            LOGGER.debug(f"Add asset to list view: {path}")
-            self.asset_list_view.add_asset(path)
+        # Rows arrive asynchronously; thumbnails are started once they are in
+        self._pending_list_load = (self._refresh_gen, entries, cache_root, cache_hashes)
+        self.asset_list_view.add_assets(assets)
 
-            task = ThumbTask(path, self.thumb_px, cache_root)
-            task.signals.done.connect(self._on_list_thumb_ready)
-            self.thread_pool.start(task)
+    def _on_list_assets_loaded(self):
+        """Start thumbnail scheduling for a list refresh once its rows are loaded."""
+        pending = self._pending_list_load
+        if pending is None or pending[0] != self._refresh_gen:
+            return
+        self._pending_list_load = None
+        _, entries, cache_root, cache_hashes = pending
+        self._start_thumb_scheduling(entries, cache_root, cache_hashes, self._on_list_thumbs_ready)
+
+    def _on_list_thumbs_ready(self, generation, results):
+        """Handle a batch of generated thumbnails for list view."""
+        if generation != self._refresh_gen:
+            return
+        for result in results:
+            self._on_list_thumb_ready(result)
 
     def _on_list_thumb_ready(self, result):
         """Handle thumbnail generation completion for list view."""
@@ -583,49 +814,67 @@ class MainWindow(QMainWindow):
             index = indexes[0]
             selected_path = self.asset_list_view.model.data(index, Qt.UserRole)
             if selected_path == result.path:
+                metadata = result.meta_text
+                if metadata is None:
+                    metadata = ImageProcessor.read_metadata(result.path)
+                    self.asset_list_view.model.set_asset_metadata(index.row(), metadata)
                 self.preview.show_preview(result.pixmap)
-                self.preview.set_metadata(result.meta_text)
+                self.preview.set_metadata(metadata)
+
+    def _on_thumbs_ready(self, generation, results):
+        """Handle a batch of generated thumbnails for grid view."""
+        if generation != self._refresh_gen:
+            return
+        for result in results:
+            self._on_thumb_ready(result)
 
     def _on_thumb_ready(self, result):
         """Handle thumbnail generation completion."""
+        it = self._path_to_item.get(result.path)
+        if it is None:
+            return
+        if result.pixmap:
+            # The view scales the canonical thumbnail to its iconSize when painting
+            it.setIcon(QIcon(result.pixmap))
+        else:
+            it.setIcon(self._placeholder_icon(self.thumb_px, self._thumb_height, Qt.darkGray))
+        it.setData(Qt.UserRole, result.meta_text)
+        if it.isSelected():
+            self.preview.show_preview(result.pixmap)
+            self.preview.set_metadata(self._item_metadata(it))
+        LOGGER.debug("Updated UI item for %s", result.path)
+
+    def _set_thumb_px(self, px: int):
+        """Set the grid thumbnail width and the item sizes and placeholder derived from it."""
+        self.thumb_px = int(px)
+        # Items keep a 16:9 thumbnail with some padding for the label
+        self._thumb_height = int(self.thumb_px * 9 / 16)
+        self._item_size_hint = QSize(self.thumb_px + 16, self._thumb_height + 36)
+        # Placeholders of the old size are only referenced by existing items now
+        self._placeholder_icons.clear()
+        self._loading_icon = self._placeholder_icon(self.thumb_px, self._thumb_height, Qt.black)
+
+    def _placeholder_icon(self, width: int, height: int, color) -> QIcon:
+        """Get the shared solid-color placeholder icon for the given size."""
+        key = (width, height, color)
+        icon = self._placeholder_icons.get(key)
+        if icon is None:
+            icon = self._placeholder_icons[key] = QIcon(ImageProcessor.placeholder_pixmap(width, height, color))
+        return icon
+
+    def _resize_grid_items(self):
+        """Give grid items the item size for the current thumbnail size."""
         for i in range(self.list.count()):
-            it = self.list.item(i)
-            if it.data(Qt.UserRole + 1) == result.path:
-                if result.pixmap:
-                    it.setIcon(QIcon(result.pixmap))
-                else:
-                    placeholder = QPixmap(self.thumb_px, int(self.thumb_px * 9 / 16))
-                    placeholder.fill(Qt.darkGray)
-                    it.setIcon(QIcon(placeholder))
-                it.setData(Qt.UserRole, result.meta_text)
-                if it.isSelected():
-                    self.preview.show_preview(result.pixmap)
-                    self.preview.set_metadata(result.meta_text)
-                LOGGER.debug(f"Updated UI item for {result.path}")
-                break
+            self.list.item(i).setSizeHint(self._item_size_hint)
+        # Smaller thumbnails bring more items into view
+        self._schedule_visible_thumbs()
 
     def _open_settings(self):
         """Open the settings dialog."""
         dialog = SettingsDialog(self)
         
         # Load current settings into dialog
-        dialog.thumb_size_spin.setValue(self.settings['thumb_size'])
-        dialog.grid_spacing.setValue(self.settings['grid_spacing'])
-        dialog.cache_enabled.setChecked(self.settings['cache_enabled'])
-        dialog.show_metadata.setChecked(self.settings['show_metadata'])
-        dialog.show_tree_view.setChecked(self.settings['show_tree_view'])
-        dialog.thread_count.setValue(self.settings['thread_count'])
-        dialog.preload_thumbnails.setChecked(self.settings['preload_thumbnails'])
-        dialog.max_cache_size.setValue(self.settings['max_cache_size'])
-        dialog.auto_clear_cache.setChecked(self.settings['auto_clear_cache'])
-        dialog.log_level.setCurrentText(self.settings['log_level'])
-        dialog.enable_debug.setChecked(self.settings['enable_debug'])
-        dialog.use_oiio.setChecked(self.settings['use_oiio'])
-        dialog.hdr_tonemap.setChecked(self.settings['hdr_tonemap'])
-        
-        # Load format settings
-        for fmt, checkbox in dialog.format_checkboxes.items():
-            checkbox.setChecked(self.settings['supported_formats'].get(fmt, True))
+        dialog.load_settings(self.settings)
         
         if dialog.exec() == SettingsDialog.Accepted:
             # Apply and save settings
@@ -638,19 +887,23 @@ class MainWindow(QMainWindow):
         """Apply settings from the settings dialog."""
         # Apply thumbnail size
         if settings['thumb_size'] != self.thumb_px:
-            self.thumb_px = settings['thumb_size']
+            self._set_thumb_px(settings['thumb_size'])
             self.size_slider.setValue(self.thumb_px)
             if self.view_mode == 'grid':
                 self.list.set_thumb_size(self.thumb_px)
+                self._resize_grid_items()
             else:
                 self.asset_list_view.set_thumbnail_size(self.thumb_px)
-            self._refresh_thumbs()  # Regenerate thumbnails with new size
         
         # Apply grid spacing (only affects grid view)
         self.list.setSpacing(settings['grid_spacing'])
         
         # Apply thread count
         QThreadPool.globalInstance().setMaxThreadCount(settings['thread_count'])
+        self._thumb_scheduler.batch_size = settings['thumb_batch_size']
+
+        # Resize in-memory thumbnail cache
+        PIXMAP_CACHE.set_max_items(settings['max_cache_size'] * constants.PIXMAP_CACHE_ITEMS_PER_MB)
         
         # Show/hide metadata panel
         self.preview.setVisible(settings['show_metadata'])
@@ -677,66 +930,91 @@ class MainWindow(QMainWindow):
         """Toggle the metadata panel visibility."""
         self.preview.setVisible(checked)
         self.settings['show_metadata'] = checked
-        self.config_manager.save_settings(self.settings)
+        self._queue_settings_save()
 
     def _toggle_tree_view(self, checked):
         """Toggle the tree view visibility."""
         self.tree.setVisible(checked)
         self.settings['show_tree_view'] = checked
-        self.config_manager.save_settings(self.settings)
+        self._queue_settings_save()
+
+    def _queue_settings_save(self):
+        """Save settings after SETTINGS_SAVE_DELAY_MS, coalescing rapid changes into one write."""
+        self._settings_dirty = True
+        self._settings_save_timer.start()
+
+    def _flush_settings(self):
+        """Write queued settings changes, if any."""
+        self._settings_save_timer.stop()
+        if self._settings_dirty:
+            self._settings_dirty = False
+            self.config_manager.save_settings(self.settings)
+
+    def closeEvent(self, event):
+        """Write any queued settings before the window closes."""
+        self._flush_settings()
+        super().closeEvent(event)
+
+    def _start_clear_cache(self, task: ClearCacheTask):
+        """Run a cache clearing task, stopping thumbnail work that would write into it."""
+        self._cancel_thumb_work()
+        self.status_bar.showMessage("Clearing cache...")
+        self.cache_pool.start(task)
+
+    def _on_cache_cleared(self, cleared_count: int = 0):
+        """Drop state describing the removed cache folders and reload thumbnails."""
+        PIXMAP_CACHE.clear()
+        CacheManager.forget_created_dirs()
+        self.status_bar.clearMessage()
+        self._refresh_thumbs()
 
     def _clear_cache_current(self):
         """Clear cache for current directory."""
         root = self._cache_root_for_dir(self.current_dir)
-        if os.path.isdir(root):
-            try:
-                shutil.rmtree(root)
-                LOGGER.info(f"Cleared cache: {root}")
-                self._refresh_thumbs()
-            except Exception as e:
-                LOGGER.error(f"Failed to clear cache at {root}: {e}")
-                QMessageBox.critical(self, "Clear Cache Failed", 
-                                   f"Could not remove cache folder:\n{root}\n\n{e}")
-        else:
+        if not os.path.isdir(root):
             LOGGER.info(f"No cache folder to clear: {root}")
             QMessageBox.information(self, "Clear Cache", 
                                   "No cache folder found in current directory.")
+            return
+        self._clearing_cache_root = root
+        task = ClearCacheTask([root])
+        task.signals.finished.connect(self._on_cache_cleared)
+        # A bound method, not a partial: a functor slot's queued call is
+        # dropped along with the task's signal object once the task is done
+        task.signals.failed.connect(self._on_current_cache_clear_failed)
+        self._start_clear_cache(task)
+
+    def _on_current_cache_clear_failed(self, error: str):
+        """Report a failed current directory cache clear."""
+        self._on_cache_cleared()
+        QMessageBox.critical(self, "Clear Cache Failed", 
+                           f"Could not remove cache folder:\n{self._clearing_cache_root}\n\n{error}")
 
     def _clear_all_cache(self):
         """Clear all thumbnail cache files."""
-        try:
-            cleared_count = 0
-            
-            # Clear project-based caches
-            for project_path in self.projects_list:
-                if os.path.exists(project_path):
-                    project_name = os.path.basename(project_path)
-                    cache_folder_name = f"{project_name}_AssetBrowserCache"
-                    cache_root = os.path.join(project_path, cache_folder_name)
-                    if os.path.exists(cache_root):
-                        shutil.rmtree(cache_root)
-                        cleared_count += 1
-            
-            # Also clear any old-style .assetbrowser_cache folders for backward compatibility
-            for project_path in self.projects_list:
-                if os.path.exists(project_path):
-                    for root, dirs, files in os.walk(project_path):
-                        if '.assetbrowser_cache' in dirs:
-                            cache_path = os.path.join(root, '.assetbrowser_cache')
-                            shutil.rmtree(cache_path)
-                            cleared_count += 1
-            
-            if cleared_count > 0:
-                QMessageBox.information(self, "Cache Cleared", 
-                                      f"Cleared {cleared_count} cache directories.")
-            else:
-                QMessageBox.information(self, "Cache Cleared", 
-                                      "No cache directories found to clear.")
-            self._refresh_thumbs()
-            
-        except Exception as e:
-            LOGGER.error(f"Error clearing all cache: {e}")
-            QMessageBox.warning(self, "Error", f"Failed to clear all cache: {e}")
+        # Project-based caches, plus old-style .assetbrowser_cache folders
+        # anywhere under the projects for backward compatibility
+        projects = list(self.projects_list)
+        cache_roots = [os.path.join(p, f"{os.path.basename(p)}_AssetBrowserCache") for p in projects]
+        task = ClearCacheTask(cache_roots, projects)
+        task.signals.finished.connect(self._on_all_cache_cleared)
+        task.signals.failed.connect(self._on_all_cache_clear_failed)
+        self._start_clear_cache(task)
+
+    def _on_all_cache_cleared(self, cleared_count: int):
+        """Handle completion of a clear of all caches."""
+        self._on_cache_cleared()
+        if cleared_count > 0:
+            QMessageBox.information(self, "Cache Cleared", 
+                                  f"Cleared {cleared_count} cache directories.")
+        else:
+            QMessageBox.information(self, "Cache Cleared", 
+                                  "No cache directories found to clear.")
+
+    def _on_all_cache_clear_failed(self, error: str):
+        """Report a failed clear of all caches."""
+        self._on_cache_cleared()
+        QMessageBox.warning(self, "Error", f"Failed to clear all cache: {error}")
 
     def _open_cache_folder(self):
         """Open the thumbnail cache directory in file explorer."""
@@ -755,54 +1033,19 @@ class MainWindow(QMainWindow):
 
     def _show_shortcuts(self):
         """Show keyboard shortcuts dialog."""
-        shortcuts_text = """
-<h3>Keyboard Shortcuts</h3>
-<table>
-<tr><td><b>Ctrl+N</b></td><td>New Project</td></tr>
-<tr><td><b>Ctrl+O</b></td><td>Open Folder</td></tr>
-<tr><td><b>Ctrl+F</b></td><td>Focus Search Field</td></tr>
-<tr><td><b>Ctrl+,</b></td><td>Open Settings</td></tr>
-<tr><td><b>F5</b></td><td>Refresh View</td></tr>
-<tr><td><b>F1</b></td><td>Show Shortcuts</td></tr>
-<tr><td><b>Ctrl+Q</b></td><td>Exit Application</td></tr>
-<tr><td><b>Double-click</b></td><td>Open File</td></tr>
-</table>
-        """
-        
-        msg = QMessageBox(self)
-        msg.setWindowTitle("Keyboard Shortcuts")
-        msg.setTextFormat(Qt.RichText)
-        msg.setText(shortcuts_text)
-        msg.exec()
+        self._show_message('_shortcuts_msg', "Keyboard Shortcuts", _SHORTCUTS_HTML)
 
     def _show_about(self):
         """Show about dialog."""
-        about_text = """
-<h2>Asset Browser</h2>
-<p><b>Version:</b> 1.0</p>
-<p><b>Description:</b> A standalone asset browser built with Python, OpenCV, OpenImageIO, and PySide6</p>
+        self._show_message('_about_msg', "About Asset Browser", _ABOUT_HTML)
 
-<h3>Features:</h3>
-<ul>
-<li>Browse folders and view thumbnails in a grid</li>
-<li>Support for many image formats (including EXR, TIFF, HDR)</li>
-<li>Video thumbnail support (first frame)</li>
-<li>Search filtering with regex support</li>
-<li>Adjustable thumbnail size</li>
-<li>Preview pane with metadata</li>
-<li>Disk thumbnail cache</li>
-<li>Light/dark theme awareness</li>
-</ul>
-
-<h3>Supported Formats:</h3>
-<p><b>Images:</b> JPG, PNG, BMP, TIFF, GIF, EXR, HDR, DPX, PSD, SVG, JP2</p>
-<p><b>Videos:</b> MP4, MOV, AVI, MKV, WEBM</p>
-
-<p><b>Built with:</b> Python 3.10+, PySide6, OpenCV, OpenImageIO</p>
-        """
-        
-        msg = QMessageBox(self)
-        msg.setWindowTitle("About Asset Browser")
-        msg.setTextFormat(Qt.RichText)
-        msg.setText(about_text)
+    def _show_message(self, attr: str, title: str, text: str):
+        """Show a rich text message box, keeping it in attr for the next time."""
+        msg = getattr(self, attr)
+        if msg is None:
+            msg = QMessageBox(self)
+            msg.setWindowTitle(title)
+            msg.setTextFormat(Qt.RichText)
+            msg.setText(text)
+            setattr(self, attr, msg)
         msg.exec()
@@ -3,11 +3,12 @@ Preview pane widget for displaying asset previews and metadata.
 """
 
 from typing import Optional
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QPixmap
+from PySide6.QtCore import Qt, QTimer
+from PySide6.QtGui import QPixmap, QPixmapCache
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QLabel, QTextEdit, QSizePolicy
 )
+from ..config.constants import PREVIEW_SMOOTH_DELAY_MS
 
 
 class PreviewPane(QWidget):
@@ -15,6 +16,12 @@ class PreviewPane(QWidget):
     
     def __init__(self):
         super().__init__()
+        self._orig: Optional[QPixmap] = None  # Unscaled pixmap being previewed
+        # Resizes show a fast scaling; the smooth one follows once they stop
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(PREVIEW_SMOOTH_DELAY_MS)
+        self._resize_timer.timeout.connect(self._final_rescale)
         self._setup_ui()
 
     def _setup_ui(self):
@@ -35,15 +42,32 @@ class PreviewPane(QWidget):
 
     def show_preview(self, pix: Optional[QPixmap]):
         """Display a preview pixmap."""
+        self._orig = pix
         if pix is None:
             self.preview.setText("No preview")
             self.preview.setPixmap(QPixmap())
             return
-        self.preview.setPixmap(pix.scaled(
-            self.preview.size(), 
-            Qt.KeepAspectRatio, 
-            Qt.SmoothTransformation
-        ))
+        self._rescale()
+
+    def _scaled_key(self) -> str:
+        """Get the QPixmapCache key of the original smoothly scaled to the label."""
+        target = self.preview.size()
+        return f"pp_{self._orig.cacheKey()}_{target.width()}x{target.height()}"
+
+    def _rescale(self):
+        """Show the original pixmap smoothly scaled to the label, reusing earlier scalings."""
+        self._resize_timer.stop()
+        key = self._scaled_key()
+        scaled = QPixmapCache.find(key)
+        if scaled is None:
+            scaled = self._orig.scaled(self.preview.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation)
+            QPixmapCache.insert(key, scaled)
+        self.preview.setPixmap(scaled)
+
+    def _final_rescale(self):
+        """Replace the fast scaling shown during a resize with the smooth one."""
+        if self._orig is not None:
+            self._rescale()
 
     def set_metadata(self, meta_text: str):
         """Set the metadata text."""
@@ -52,10 +76,12 @@ class PreviewPane(QWidget):
     def resizeEvent(self, e):
         """Handle resize events to maintain preview scaling."""
         super().resizeEvent(e)
-        pix = self.preview.pixmap()
-        if pix:
-            self.preview.setPixmap(pix.scaled(
-                self.preview.size(), 
-                Qt.KeepAspectRatio, 
-                Qt.SmoothTransformation
-            ))
+        # Scale from the original so repeated resizes don't compound blur
+        if self._orig is None:
+            return
+        scaled = QPixmapCache.find(self._scaled_key())
+        if scaled is not None:
+            self.preview.setPixmap(scaled)
+            return
+        self.preview.setPixmap(self._orig.scaled(self.preview.size(), Qt.KeepAspectRatio, Qt.FastTransformation))
+        self._resize_timer.start()
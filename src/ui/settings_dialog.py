@@ -3,19 +3,27 @@ Settings dialog for configuring the Asset Browser.
 """
 
 import os
-from typing import Dict, Any
+from typing import Dict, Any, Callable, Tuple
 from PySide6.QtCore import Qt, QThreadPool
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QTabWidget, QWidget,
     QGroupBox, QFormLayout, QCheckBox, QSpinBox, QComboBox,
     QPushButton, QLabel, QDialogButtonBox, QMessageBox
 )
+from ..config.config_manager import ConfigManager
+from ..config.constants import THUMB_BATCH_SIZE
+from ..thumbnail.cache_size_task import CacheSizeTask
 
 try:
     import OpenImageIO as oiio
 except ImportError:
     oiio = None
 
+# Format checkboxes, in display order
+_IMAGE_FORMATS = (".jpg", ".jpeg", ".png", ".bmp", ".tiff", ".tif", ".gif",
+                  ".exr", ".hdr", ".dpx", ".psd", ".svg", ".jp2")
+_VIDEO_FORMATS = (".mp4", ".mov", ".avi", ".mkv", ".webm")
+
 
 class SettingsDialog(QDialog):
     """Settings dialog for the Asset Browser."""
@@ -26,6 +34,12 @@ class SettingsDialog(QDialog):
         self.setWindowTitle("Asset Browser Settings")
         self.setModal(True)
         self.resize(500, 400)
+        self._cache_info_gen = 0  # Bumped per cache measurement; older results are dropped
+        self._cache_info_root = ""  # Folder being measured
+        # Setting values, kept here for the tabs not built yet
+        self._values = self._default_values()
+        self._values['thread_count'] = QThreadPool.globalInstance().maxThreadCount()  # Read once per dialog
+        self._fields: Dict[str, Tuple[Callable, Callable]] = {}  # Setting -> (getter, setter) of its built widget
         self._setup_ui()
 
     def _setup_ui(self):
@@ -33,14 +47,20 @@ class SettingsDialog(QDialog):
         layout = QVBoxLayout(self)
         
         # Tab widget for organized settings
-        tabs = QTabWidget()
-        layout.addWidget(tabs)
-        
-        # Create tabs
-        tabs.addTab(self._create_general_tab(), "General")
-        tabs.addTab(self._create_performance_tab(), "Performance")
-        tabs.addTab(self._create_formats_tab(), "File Formats")
-        tabs.addTab(self._create_advanced_tab(), "Advanced")
+        self.tabs = QTabWidget()
+        layout.addWidget(self.tabs)
+        
+        # Create tabs as empty pages; each is filled in the first time it is
+        # shown, so opening the dialog only builds the General tab
+        self._tab_builders = [self._create_general_tab, self._create_performance_tab,
+                              self._create_formats_tab, self._create_advanced_tab]
+        self._tab_built = [False] * len(self._tab_builders)
+        for title in ("General", "Performance", "File Formats", "Advanced"):
+            page = QWidget()
+            QVBoxLayout(page).setContentsMargins(0, 0, 0, 0)
+            self.tabs.addTab(page, title)
+        self._ensure_tab(0)
+        self.tabs.currentChanged.connect(self._ensure_tab)
         
         # Dialog buttons
         buttons = QDialogButtonBox(
@@ -50,8 +70,33 @@ class SettingsDialog(QDialog):
         buttons.rejected.connect(self.reject)
         buttons.button(QDialogButtonBox.RestoreDefaults).clicked.connect(self._restore_defaults)
         layout.addWidget(buttons)
-        
-        self._update_cache_info()
+
+    def _ensure_tab(self, index: int):
+        """Build the tab at index if it has not been built yet."""
+        if index < 0 or self._tab_built[index]:
+            return
+        self._tab_built[index] = True
+        existing = set(self._fields)
+        self.tabs.widget(index).layout().addWidget(self._tab_builders[index]())
+        for key, (_, setter) in self._fields.items():
+            if key not in existing:
+                setter(self._values[key])
+
+    def _add_field(self, key: str, getter: Callable, setter: Callable):
+        """Register the widget accessors for a setting shown on a tab."""
+        self._fields[key] = (getter, setter)
+
+    def load_settings(self, settings: Dict[str, Any]):
+        """Show the given settings, in built tabs now and in the others once built."""
+        for key in self._values:
+            if key not in settings:
+                continue
+            value = settings[key]
+            if key == 'supported_formats':
+                value = {fmt: value.get(fmt, True) for fmt in _IMAGE_FORMATS + _VIDEO_FORMATS}
+            self._values[key] = value
+            if key in self._fields:
+                self._fields[key][1](value)
 
     def _create_general_tab(self) -> QWidget:
         """Create the general settings tab."""
@@ -93,6 +138,12 @@ class SettingsDialog(QDialog):
         display_layout.addRow("Folder Tree:", self.show_tree_view)
         
         layout.addWidget(display_group)
+
+        self._add_field('thumb_size', self.thumb_size_spin.value, self.thumb_size_spin.setValue)
+        self._add_field('cache_enabled', self.cache_enabled.isChecked, self.cache_enabled.setChecked)
+        self._add_field('grid_spacing', self.grid_spacing.value, self.grid_spacing.setValue)
+        self._add_field('show_metadata', self.show_metadata.isChecked, self.show_metadata.setChecked)
+        self._add_field('show_tree_view', self.show_tree_view.isChecked, self.show_tree_view.setChecked)
         
         return tab
 
@@ -107,8 +158,12 @@ class SettingsDialog(QDialog):
         
         self.thread_count = QSpinBox()
         self.thread_count.setRange(1, 16)
-        self.thread_count.setValue(QThreadPool.globalInstance().maxThreadCount())
         thread_layout.addRow("Max Thread Count:", self.thread_count)
+
+        self.thumb_batch_size = QSpinBox()
+        self.thumb_batch_size.setRange(1, 128)
+        self.thumb_batch_size.setValue(THUMB_BATCH_SIZE)
+        thread_layout.addRow("Thumbnail Batch Size:", self.thumb_batch_size)
         
         self.preload_thumbnails = QCheckBox("Preload thumbnails")
         self.preload_thumbnails.setChecked(True)
@@ -131,6 +186,12 @@ class SettingsDialog(QDialog):
         memory_layout.addRow("Auto-clear:", self.auto_clear_cache)
         
         layout.addWidget(memory_group)
+
+        self._add_field('thread_count', self.thread_count.value, self.thread_count.setValue)
+        self._add_field('thumb_batch_size', self.thumb_batch_size.value, self.thumb_batch_size.setValue)
+        self._add_field('preload_thumbnails', self.preload_thumbnails.isChecked, self.preload_thumbnails.setChecked)
+        self._add_field('max_cache_size', self.max_cache_size.value, self.max_cache_size.setValue)
+        self._add_field('auto_clear_cache', self.auto_clear_cache.isChecked, self.auto_clear_cache.setChecked)
         
         return tab
 
@@ -143,26 +204,21 @@ class SettingsDialog(QDialog):
         image_group = QGroupBox("Supported Image Formats")
         image_layout = QVBoxLayout(image_group)
         
-        self.format_checkboxes = {}
-        image_formats = [".jpg", ".jpeg", ".png", ".bmp", ".tiff", ".tif", ".gif", 
-                        ".exr", ".hdr", ".dpx", ".psd", ".svg", ".jp2"]
-        
-        # Create checkboxes in a grid layout
+        # Create checkboxes in a grid layout, parented to their container so
+        # adding them to a layout does not reparent them
         format_grid = QWidget()
         format_grid_layout = QHBoxLayout(format_grid)
         
         left_col = QVBoxLayout()
         right_col = QVBoxLayout()
         
-        for i, fmt in enumerate(image_formats):
-            checkbox = QCheckBox(fmt.upper())
-            checkbox.setChecked(True)
-            self.format_checkboxes[fmt] = checkbox
-            
-            if i < len(image_formats) // 2:
-                left_col.addWidget(checkbox)
-            else:
-                right_col.addWidget(checkbox)
+        half = len(_IMAGE_FORMATS) // 2
+        self.format_checkboxes = {}
+        for col, formats in ((left_col, _IMAGE_FORMATS[:half]), (right_col, _IMAGE_FORMATS[half:])):
+            for fmt in formats:
+                checkbox = QCheckBox(fmt.upper(), format_grid)
+                self.format_checkboxes[fmt] = checkbox
+                col.addWidget(checkbox)
         
         format_grid_layout.addLayout(left_col)
         format_grid_layout.addLayout(right_col)
@@ -174,21 +230,30 @@ class SettingsDialog(QDialog):
         video_group = QGroupBox("Supported Video Formats")
         video_layout = QVBoxLayout(video_group)
         
-        video_formats = [".mp4", ".mov", ".avi", ".mkv", ".webm"]
         video_grid = QWidget()
         video_grid_layout = QHBoxLayout(video_grid)
         
-        for fmt in video_formats:
-            checkbox = QCheckBox(fmt.upper())
-            checkbox.setChecked(True)
+        for fmt in _VIDEO_FORMATS:
+            checkbox = QCheckBox(fmt.upper(), video_grid)
             self.format_checkboxes[fmt] = checkbox
             video_grid_layout.addWidget(checkbox)
         
         video_layout.addWidget(video_grid)
         layout.addWidget(video_group)
+
+        self._add_field('supported_formats', self._get_formats, self._set_formats)
         
         return tab
 
+    def _get_formats(self) -> Dict[str, bool]:
+        """Get the format checkbox states."""
+        return {fmt: cb.isChecked() for fmt, cb in self.format_checkboxes.items()}
+
+    def _set_formats(self, formats: Dict[str, bool]):
+        """Set the format checkboxes, checking formats missing from formats."""
+        for fmt, checkbox in self.format_checkboxes.items():
+            checkbox.setChecked(formats.get(fmt, True))
+
     def _create_advanced_tab(self) -> QWidget:
         """Create the advanced settings tab."""
         tab = QWidget()
@@ -246,6 +311,14 @@ class SettingsDialog(QDialog):
         cache_layout.addWidget(self.cache_info)
         
         layout.addWidget(cache_group)
+
+        self._add_field('log_level', self.log_level.currentText, self.log_level.setCurrentText)
+        self._add_field('enable_debug', self.enable_debug.isChecked, self.enable_debug.setChecked)
+        self._add_field('use_oiio', self.use_oiio.isChecked, self.use_oiio.setChecked)
+        self._add_field('hdr_tonemap', self.hdr_tonemap.isChecked, self.hdr_tonemap.setChecked)
+
+        # Measured only once the tab is first shown
+        self._update_cache_info()
         
         return tab
 
@@ -271,85 +344,99 @@ class SettingsDialog(QDialog):
     
     def _restore_defaults(self):
         """Reset all settings to defaults."""
-        self.thumb_size_spin.setValue(256)
-        self.cache_enabled.setChecked(True)
-        self.grid_spacing.setValue(8)
-        self.show_metadata.setChecked(True)
-        self.show_tree_view.setChecked(True)
-        self.thread_count.setValue(QThreadPool.globalInstance().maxThreadCount())
-        self.preload_thumbnails.setChecked(True)
-        self.max_cache_size.setValue(100)
-        self.auto_clear_cache.setChecked(False)
-        self.log_level.setCurrentText("INFO")
-        self.enable_debug.setChecked(False)
-        self.use_oiio.setChecked(oiio is not None)
-        self.hdr_tonemap.setChecked(True)
-        
-        # Reset format checkboxes
-        for checkbox in self.format_checkboxes.values():
-            checkbox.setChecked(True)
+        self.load_settings(self._default_values())
+
+    @staticmethod
+    def _default_values() -> Dict[str, Any]:
+        """Get the values Restore Defaults shows."""
+        return {
+            'thumb_size': 256,
+            'cache_enabled': True,
+            'grid_spacing': 8,
+            'show_metadata': True,
+            'show_tree_view': True,
+            'thread_count': ConfigManager.default_thread_count(),
+            'thumb_batch_size': THUMB_BATCH_SIZE,
+            'preload_thumbnails': True,
+            'max_cache_size': 100,
+            'auto_clear_cache': False,
+            'log_level': "INFO",
+            'enable_debug': False,
+            'use_oiio': oiio is not None,
+            'hdr_tonemap': True,
+            'supported_formats': {fmt: True for fmt in _IMAGE_FORMATS + _VIDEO_FORMATS},
+        }
     
     def _update_cache_info(self):
-        """Update cache information display."""
-        if self.parent_browser:
-            cache_root = self.parent_browser._cache_root_for_dir(self.parent_browser.current_dir)
-            if os.path.exists(cache_root):
-                try:
-                    # Calculate cache size
-                    total_size = 0
-                    file_count = 0
-                    for root, dirs, files in os.walk(cache_root):
-                        for file in files:
-                            file_path = os.path.join(root, file)
-                            total_size += os.path.getsize(file_path)
-                            file_count += 1
-                    
-                    size_mb = total_size / (1024 * 1024)
-                    
-                    # Show project cache info if available
-                    if self.parent_browser.current_project:
-                        project_name = os.path.basename(self.parent_browser.current_project)
-                        self.cache_info.setText(
-                            f"Project '{project_name}' cache:\n"
-                            f"{file_count} files, {size_mb:.1f} MB\n"
-                            f"Location: {cache_root}"
-                        )
-                    else:
-                        self.cache_info.setText(
-                            f"Current folder cache:\n"
-                            f"{file_count} files, {size_mb:.1f} MB\n"
-                            f"Location: {cache_root}"
-                        )
-                except Exception as e:
-                    self.cache_info.setText(f"Error reading cache info: {e}")
-            else:
-                if self.parent_browser.current_project:
-                    project_name = os.path.basename(self.parent_browser.current_project)
-                    self.cache_info.setText(
-                        f"No cache yet for project '{project_name}'\n"
-                        f"Will be created at: {cache_root}"
-                    )
-                else:
-                    self.cache_info.setText("No cache folder in current directory")
-        else:
+        """Update cache information display.
+
+        The cache is measured on a worker thread, so opening the dialog does
+        not wait on a walk of every cached thumbnail.
+        """
+        if not self.parent_browser:
             self.cache_info.setText("Cache information not available")
-    
+            return
+        cache_root = self.parent_browser._cache_root_for_dir(self.parent_browser.current_dir)
+        if not os.path.exists(cache_root):
+            self._show_no_cache_info(cache_root)
+            return
+
+        self.cache_info.setText("Reading cache information...")
+        self._cache_info_gen += 1
+        self._cache_info_root = cache_root
+        task = CacheSizeTask(cache_root, self._cache_info_gen)
+        task.signals.finished.connect(self._show_cache_info)
+        task.signals.failed.connect(self._show_cache_info_error)
+        # The browser's cache pool runs tasks in order, so a measurement after
+        # a clear sees the cleared folder
+        pool = getattr(self.parent_browser, 'cache_pool', None) or QThreadPool.globalInstance()
+        pool.start(task)
+
+    def _show_cache_info(self, generation: int, total_size: int, file_count: int):
+        """Display a finished cache measurement."""
+        if generation != self._cache_info_gen:
+            return
+        cache_root = self._cache_info_root
+        if not file_count and not os.path.exists(cache_root):
+            self._show_no_cache_info(cache_root)
+            return
+        size_mb = total_size / (1024 * 1024)
+
+        # Show project cache info if available
+        if self.parent_browser.current_project:
+            project_name = os.path.basename(self.parent_browser.current_project)
+            self.cache_info.setText(
+                f"Project '{project_name}' cache:\n"
+                f"{file_count} files, {size_mb:.1f} MB\n"
+                f"Location: {cache_root}"
+            )
+        else:
+            self.cache_info.setText(
+                f"Current folder cache:\n"
+                f"{file_count} files, {size_mb:.1f} MB\n"
+                f"Location: {cache_root}"
+            )
+
+    def _show_cache_info_error(self, generation: int, error: str):
+        """Display a failed cache measurement."""
+        if generation == self._cache_info_gen:
+            self.cache_info.setText(f"Error reading cache info: {error}")
+
+    def _show_no_cache_info(self, cache_root: str):
+        """Display that the cache folder does not exist yet."""
+        if self.parent_browser.current_project:
+            project_name = os.path.basename(self.parent_browser.current_project)
+            self.cache_info.setText(
+                f"No cache yet for project '{project_name}'\n"
+                f"Will be created at: {cache_root}"
+            )
+        else:
+            self.cache_info.setText("No cache folder in current directory")
+
     def get_settings(self) -> Dict[str, Any]:
         """Return a dictionary of all current settings."""
-        settings = {
-            'thumb_size': self.thumb_size_spin.value(),
-            'cache_enabled': self.cache_enabled.isChecked(),
-            'grid_spacing': self.grid_spacing.value(),
-            'show_metadata': self.show_metadata.isChecked(),
-            'show_tree_view': self.show_tree_view.isChecked(),
-            'thread_count': self.thread_count.value(),
-            'preload_thumbnails': self.preload_thumbnails.isChecked(),
-            'max_cache_size': self.max_cache_size.value(),
-            'auto_clear_cache': self.auto_clear_cache.isChecked(),
-            'log_level': self.log_level.currentText(),
-            'enable_debug': self.enable_debug.isChecked(),
-            'use_oiio': self.use_oiio.isChecked(),
-            'hdr_tonemap': self.hdr_tonemap.isChecked(),
-            'supported_formats': {fmt: cb.isChecked() for fmt, cb in self.format_checkboxes.items()}
-        }
+        # Tabs never opened still hold the loaded values
+        settings = dict(self._values)
+        for key, (getter, _) in self._fields.items():
+            settings[key] = getter()
         return settings
@@ -2,12 +2,16 @@
 Thumbnail list widget for displaying asset thumbnails.
 """
 
-from PySide6.QtCore import Qt, QSize
+from typing import List
+from PySide6.QtCore import Qt, QSize, Signal
 from PySide6.QtWidgets import QListWidget
+from ..config.constants import THUMB_PREFETCH_ROWS
 
 
 class ThumbList(QListWidget):
     """Custom list widget for displaying thumbnails in a grid."""
+
+    viewport_changed = Signal()  # Scrolled or resized; visible items may need thumbnails
     
     def __init__(self):
         super().__init__()
@@ -18,7 +22,10 @@ class ThumbList(QListWidget):
         # Use 16:9 aspect ratio (landscape) for thumbnails
         self.setIconSize(QSize(256, 144))  # 16:9 ratio starting size
         self.setWordWrap(True)
-        self.setUniformItemSizes(False)
+        # Every item shares the window's item size hint, so layout can take the
+        # first item's size for all of them
+        self.setUniformItemSizes(True)
+        self.verticalScrollBar().valueChanged.connect(self.viewport_changed)
 
     def set_thumb_size(self, px: int):
         """Set thumbnail size maintaining 16:9 aspect ratio."""
@@ -26,3 +33,42 @@ class ThumbList(QListWidget):
         # Maintain 16:9 aspect ratio (width:height)
         height = int(px * 9 / 16)
         self.setIconSize(QSize(px, height))
+
+    def showEvent(self, event):
+        """Report being shown; nothing is in view while the widget is hidden."""
+        super().showEvent(event)
+        self.viewport_changed.emit()
+
+    def resizeEvent(self, event):
+        """Report resizes, which can bring more items into view."""
+        super().resizeEvent(event)
+        self.viewport_changed.emit()
+
+    def visible_paths(self, prefetch_rows: int = THUMB_PREFETCH_ROWS) -> List[str]:
+        """Get the paths of items in the viewport, plus prefetch_rows rows either side."""
+        count = self.count()
+        if count == 0 or not self.isVisible():
+            return []
+        row_height = self.item(0).sizeHint().height() + 2 * self.spacing()
+        area = self.viewport().rect()
+        top = area.top() - prefetch_rows * row_height
+        bottom = area.bottom() + prefetch_rows * row_height
+
+        # Static icon mode lays items out row by row, so their rects are sorted
+        # by y; binary search the first and last rows in range
+        lo, hi = 0, count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.visualItemRect(self.item(mid)).bottom() < top:
+                lo = mid + 1
+            else:
+                hi = mid
+        first = lo
+        lo, hi = first, count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.visualItemRect(self.item(mid)).top() <= bottom:
+                lo = mid + 1
+            else:
+                hi = mid
+        return [self.item(i).data(Qt.UserRole + 1) for i in range(first, lo)]
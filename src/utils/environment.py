@@ -15,17 +15,23 @@ def setup_virtual_environment():
     if hasattr(sys, 'real_prefix') or (hasattr(sys, 'base_prefix') and sys.base_prefix != sys.prefix):
         return  # Already in a virtual environment
     
-    # Check if virtual environment exists and use it
-    if os.path.exists(venv_dir):
-        if sys.platform == "win32":
-            venv_python = os.path.join(venv_dir, "Scripts", "python.exe")
-        else:
-            venv_python = os.path.join(venv_dir, "bin", "python")
-        
-        if os.path.exists(venv_python) and os.path.samefile(sys.executable, venv_python):
+    # Check if virtual environment exists and use it; one stat of its
+    # python answers both whether it exists and whether it is this one
+    if sys.platform == "win32":
+        venv_python = os.path.join(venv_dir, "Scripts", "python.exe")
+    else:
+        venv_python = os.path.join(venv_dir, "bin", "python")
+    try:
+        venv_stat = os.stat(venv_python)
+    except OSError:
+        return  # No virtual environment
+    
+    try:
+        if os.path.samestat(os.stat(sys.executable), venv_stat):
             return  # Already using virtual environment Python
-        
-        # Re-execute with virtual environment Python if not already using it
-        if os.path.exists(venv_python):
-            print(f"Using virtual environment: {venv_dir}")
-            os.execv(venv_python, [venv_python] + sys.argv)
+    except OSError:
+        pass
+    
+    # Re-execute with virtual environment Python if not already using it
+    print(f"Using virtual environment: {venv_dir}")
+    os.execv(venv_python, [venv_python] + sys.argv)
@@ -3,36 +3,76 @@ File type detection utilities.
 """
 
 import os
-from ..config.constants import SUPPORTED_VIDEO_EXTS, SUPPORTED_IMAGE_EXTS
+from typing import Iterable, List, Tuple
+from ..config.constants import SUPPORTED_VIDEO_EXTS, SUPPORTED_IMAGE_EXTS, SUPPORTED_ASSET_EXTS
+
+
+_ARCHIVE_EXTS = frozenset({'7z', 'zip', 'rar', 'tar', 'gz', 'bz2'})  # Without the leading dot
+
+
+def get_extension(path: str) -> str:
+    """Get the lowercased extension of path, dot included, for membership tests.
+
+    Same result as os.path.splitext(path)[1].lower(): the leading dots of a
+    hidden file name are not an extension, nor is a dot in a directory name.
+    """
+    dot = path.rfind(".")
+    sep = max(path.rfind(os.sep), path.rfind(os.altsep) if os.altsep else -1)
+    if dot <= sep:
+        return ""
+    start = sep + 1
+    while start < dot and path[start] == ".":
+        start += 1
+    if start == dot:
+        return ""
+    return path[dot:].lower()
 
 
 def is_video(path: str) -> bool:
     """Check if the file is a supported video format."""
-    return os.path.splitext(path)[1].lower() in SUPPORTED_VIDEO_EXTS
+    return get_extension(path) in SUPPORTED_VIDEO_EXTS
 
 
 def is_image(path: str) -> bool:
     """Check if the file is a supported image format."""
-    return os.path.splitext(path)[1].lower() in SUPPORTED_IMAGE_EXTS
+    return get_extension(path) in SUPPORTED_IMAGE_EXTS
 
 
 def is_supported_asset(path: str) -> bool:
     """Check if the file is a supported asset (image or video)."""
-    return is_image(path) or is_video(path)
+    return get_extension(path) in SUPPORTED_ASSET_EXTS
+
+
+def classify_paths(paths: Iterable[str]) -> Tuple[List[bool], List[bool]]:
+    """Check many paths at once, returning (image_mask, video_mask).
+
+    Each extension is parsed once for both masks.
+    """
+    exts = [get_extension(path) for path in paths]
+    return ([ext in SUPPORTED_IMAGE_EXTS for ext in exts],
+            [ext in SUPPORTED_VIDEO_EXTS for ext in exts])
+
+
+def is_supported_asset_by_name(name: str) -> bool:
+    """Check a bare file name's extension against all supported asset formats."""
+    dot = name.rfind(".")
+    return dot > 0 and name[dot:].lower() in SUPPORTED_ASSET_EXTS
+
+
+def _is_archive_name(part: str) -> bool:
+    """Check if a path component names a compressed archive."""
+    _, dot, ext = part.rpartition(".")
+    return bool(dot) and ext.lower() in _ARCHIVE_EXTS
 
 
 def is_in_archive(path: str) -> bool:
     """Check if the file path indicates it's inside a compressed archive."""
-    archive_extensions = {'.7z', '.zip', '.rar', '.tar', '.gz', '.bz2'}
-    path_parts = os.path.normpath(path).split(os.sep)
-    return any(any(part.lower().endswith(ext) for ext in archive_extensions) for part in path_parts)
+    return any(_is_archive_name(part) for part in os.path.normpath(path).split(os.sep))
 
 
 def get_archive_name(path: str) -> str:
     """Get the name of the archive file containing this path."""
-    archive_extensions = {'.7z', '.zip', '.rar', '.tar', '.gz', '.bz2'}
-    path_parts = os.path.normpath(path).split(os.sep)
-    for part in path_parts:
-        if any(part.lower().endswith(ext) for ext in archive_extensions):
+    for part in os.path.normpath(path).split(os.sep):
+        if _is_archive_name(part):
             return part
     return ""
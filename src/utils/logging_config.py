@@ -3,8 +3,23 @@ Logging configuration and setup.
 """
 
 import os
+import atexit
+import queue
 import logging
-from logging.handlers import RotatingFileHandler
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
+
+
+class _LazyRotatingFileHandler(RotatingFileHandler):
+    """Rotating file handler that creates its folder when the file is first opened."""
+
+    def _open(self):
+        try:
+            os.makedirs(os.path.dirname(self.baseFilename), exist_ok=True)
+            return super()._open()
+        except OSError:
+            # No writable log folder: drop file records quietly, as when the
+            # handler could not be created, instead of a traceback per record
+            return open(os.devnull, self.mode, encoding=self.encoding)
 
 
 def setup_logging() -> logging.Logger:
@@ -15,21 +30,24 @@ def setup_logging() -> logging.Logger:
     logger.setLevel(level)
     
     if not logger.handlers:
-        # File handler
+        handlers = []
+
+        # File handler; its folder and file are created by the first record it
+        # writes, which with a quiet log level may never happen
         try:
             log_dir = os.path.join(os.path.expanduser("~"), ".assetbrowser_logs")
-            os.makedirs(log_dir, exist_ok=True)
-            fh = RotatingFileHandler(
+            fh = _LazyRotatingFileHandler(
                 os.path.join(log_dir, "asset_browser.log"), 
                 maxBytes=1_000_000, 
                 backupCount=3, 
-                encoding="utf-8"
+                encoding="utf-8",
+                delay=True
             )
             fh.setLevel(level)
             fh.setFormatter(logging.Formatter(
                 "%(asctime)s [%(levelname)s] %(threadName)s %(name)s: %(message)s"
             ))
-            logger.addHandler(fh)
+            handlers.append(fh)
         except Exception:
             pass
             
@@ -39,7 +57,15 @@ def setup_logging() -> logging.Logger:
         sh.setFormatter(logging.Formatter(
             "%(asctime)s [%(levelname)s] %(name)s: %(message)s"
         ))
-        logger.addHandler(sh)
+        handlers.append(sh)
+
+        # Callers only enqueue records; a listener thread does the file and
+        # console writes, so logging never blocks the GUI thread on I/O
+        log_queue = queue.SimpleQueue()
+        logger.addHandler(QueueHandler(log_queue))
+        listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+        listener.start()
+        atexit.register(listener.stop)
     
     return logger
 
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Test script for file type detection in Asset Browser.
+"""
+
+import os
+from src.utils.file_utils import get_extension, is_image, is_video, is_supported_asset, classify_paths
+
+
+def test_get_extension():
+    """get_extension must agree with os.path.splitext, lowercased."""
+    test_cases = [
+        ("shot_001.EXR", ".exr"),
+        ("/renders/shot_001.exr", ".exr"),
+        ("archive.tar.gz", ".gz"),
+        ("README", ""),                # No extension
+        ("/renders/README", ""),
+        ("trailing.", "."),
+        (".hidden", ""),               # A dotfile name is not an extension
+        ("..png", ""),
+        (".hidden.png", ".png"),
+        ("/renders/.cache/README", ""),  # Nor is a dot in a directory name
+        ("/renders/v1.2/shot", ""),
+        ("/renders/v1.2/shot.mov", ".mov"),
+        ("", ""),
+    ]
+    for path, expected in test_cases:
+        result = get_extension(path)
+        print(f"{path!r:28} -> {result!r}")
+        assert result == expected, f"{path!r}: expected {expected!r}, got {result!r}"
+        assert result == os.path.splitext(path)[1].lower(), f"{path!r} disagrees with splitext"
+    print("✓ get_extension test passed!")
+
+
+def test_type_checks():
+    """The type checks look only at the file name's extension, case-insensitively."""
+    assert is_image("/renders/shot.PNG") and not is_video("/renders/shot.PNG")
+    assert is_video("/renders/shot.Mov") and not is_image("/renders/shot.Mov")
+    assert is_supported_asset("shot.exr") and is_supported_asset("shot.mp4")
+    assert not is_supported_asset("notes.txt")
+    assert not is_supported_asset(".png")  # A dotfile, not a PNG
+    assert not is_supported_asset("/renders/v1.png/README")
+    print("✓ Type check test passed!")
+
+
+def test_classify_paths():
+    """classify_paths returns one image and one video flag per path, in order."""
+    paths = ["a.png", "b.MOV", "c.txt", ".png", "README", "d.mp4.exr"]
+    image_mask, video_mask = classify_paths(iter(paths))  # Any iterable, read once
+    assert image_mask == [True, False, False, False, False, True], image_mask
+    assert video_mask == [False, True, False, False, False, False], video_mask
+    assert classify_paths([]) == ([], [])
+    print("✓ classify_paths test passed!")
+
+
+if __name__ == "__main__":
+    test_get_extension()
+    test_type_checks()
+    test_classify_paths()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Test script for list view sorting in Asset Browser.
+"""
+
+from PySide6.QtCore import Qt, QPersistentModelIndex
+from src.ui.list_view import Asset, AssetTableModel
+
+
+def _model(rows):
+    """Build a model from (path, shot_name, frame_range, status, mtime) rows."""
+    model = AssetTableModel()
+    model.add_assets([Asset(path, path.rsplit("/", 1)[-1], path, shot, frames, status, "", mtime, None, None)
+                      for path, shot, frames, status, mtime in rows])
+    return model
+
+
+def _paths(model):
+    return [a.path for a in model.assets]
+
+
+def test_sort_columns():
+    """Each column sorts by its own key: name, shot, first frame, status, mtime."""
+    rows = [
+        ("/a/c.exr", "shot_b", "1001-1010", "WIP", 30.0),
+        ("/a/a.exr", "shot_c", "9", "Approved", 10.0),
+        ("/a/b.exr", "shot_a", "Video", "Review", None),  # No frame number, no mtime
+    ]
+    model = _model(rows)
+    model.sort(0, Qt.AscendingOrder)
+    assert _paths(model) == ["/a/a.exr", "/a/b.exr", "/a/c.exr"]
+    model.sort(1, Qt.AscendingOrder)
+    assert _paths(model) == ["/a/b.exr", "/a/c.exr", "/a/a.exr"]
+    model.sort(2, Qt.AscendingOrder)
+    assert _paths(model) == ["/a/b.exr", "/a/a.exr", "/a/c.exr"]
+    model.sort(3, Qt.DescendingOrder)
+    assert _paths(model) == ["/a/c.exr", "/a/b.exr", "/a/a.exr"]
+    model.sort(4, Qt.DescendingOrder)
+    assert _paths(model) == ["/a/c.exr", "/a/a.exr", "/a/b.exr"]
+    print("✓ Column sort test passed!")
+
+
+def test_sort_ties_keep_order():
+    """Equal keys keep their relative order in both directions, like list.sort."""
+    rows = [(f"/a/{i}.exr", "shot", "", "None", mtime)
+            for i, mtime in enumerate([2.0, 1.0, 2.0, 3.0, 1.0, 2.0])]
+    model = _model(rows)
+    for order, reverse in ((Qt.AscendingOrder, False), (Qt.DescendingOrder, True)):
+        model.sort(4, order)
+        expected = [r[0] for r in sorted(rows, key=lambda r: r[4], reverse=reverse)]
+        assert _paths(model) == expected, (order, _paths(model))
+        model.sort(0, Qt.AscendingOrder)  # Back to insertion order, by name
+    # The path index follows the rows
+    assert all(model._path_to_row[a.path] == row for row, a in enumerate(model.assets))
+    print("✓ Sort tie order test passed!")
+
+
+def test_sort_moves_persistent_indexes():
+    """Sorting is a layout change: persistent indexes follow their rows."""
+    model = _model([(f"/a/{name}.exr", "shot", "", "None", mtime)
+                    for name, mtime in (("c", 1.0), ("a", 3.0), ("b", 2.0))])
+    signals = []
+    model.dataChanged.connect(lambda *args: signals.append("dataChanged"))
+    model.layoutAboutToBeChanged.connect(lambda *args: signals.append("layoutAboutToBeChanged"))
+    model.layoutChanged.connect(lambda *args: signals.append("layoutChanged"))
+    tracked = QPersistentModelIndex(model.index(0, 3))  # /a/c.exr, Status column
+    model.sort(0, Qt.AscendingOrder)
+    assert signals == ["layoutAboutToBeChanged", "layoutChanged"], signals
+    assert (tracked.row(), tracked.column()) == (2, 3)
+    model.sort(4, Qt.DescendingOrder)
+    assert _paths(model) == ["/a/a.exr", "/a/b.exr", "/a/c.exr"] and tracked.row() == 2
+    model.sort(4, Qt.AscendingOrder)
+    assert model.assets[tracked.row()].path == "/a/c.exr" and tracked.row() == 0
+    print("✓ Sort persistent index test passed!")
+
+
+if __name__ == "__main__":
+    test_sort_columns()
+    test_sort_ties_keep_order()
+    test_sort_moves_persistent_indexes()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Test script for search refreshes reusing the folder listing in Asset Browser.
+"""
+
+import os
+import tempfile
+from collections import OrderedDict
+from src.config.constants import SEARCH_CACHE_SIZE
+from src.ui.main_window import MainWindow
+
+
+class _SearchBox:
+    """Stand-in for the search QLineEdit."""
+
+    def __init__(self):
+        self.value = ""
+
+    def text(self) -> str:
+        return self.value
+
+
+class _SearchHost:
+    """Borrows MainWindow's scan and search methods without building the window."""
+
+    _scan_assets = MainWindow._scan_assets
+    _filter_assets = MainWindow._filter_assets
+    _update_search_filter = MainWindow._update_search_filter
+
+    def __init__(self, folder: str):
+        self.search = _SearchBox()
+        self.current_dir = folder
+        self._search_text = ""
+        self._search_rx = None
+        self._search_lower = None
+        self._listing_dir = None
+        self._listing = []
+        self._query_cache = OrderedDict()
+        self.listings = 0  # Directory reads so far
+
+    def _list_assets(self, folder):
+        self.listings += 1
+        return MainWindow._list_assets(self, folder)
+
+    def names(self, query: str, reuse_listing: bool = True):
+        self.search.value = query
+        return [e.name for e in self._scan_assets(reuse_listing)]
+
+
+def _touch(path: str, mtime: int):
+    open(path, "wb").close()
+    os.utime(path, (mtime, mtime))
+
+
+def test_search_reuses_listing():
+    """Search refreshes filter the last listing; other refreshes read the folder again."""
+    with tempfile.TemporaryDirectory() as d:
+        for i, name in enumerate(["shot_a.png", "shot_b.exr", "plate_a.mov", "notes.txt"]):
+            _touch(os.path.join(d, name), 1_000_000 + i)
+        host = _SearchHost(d)
+        assert host.names("", reuse_listing=False) == ["plate_a.mov", "shot_b.exr", "shot_a.png"]
+        assert host.listings == 1
+
+        # New files are not seen by search refreshes of the same listing
+        _touch(os.path.join(d, "shot_c.png"), 2_000_000)
+        assert host.names("shot") == ["shot_b.exr", "shot_a.png"]
+        assert host.names("_A") == ["plate_a.mov", "shot_a.png"]  # Case-insensitive regex
+        assert host.names("[a") == []  # Invalid regex falls back to a substring match
+        assert host.listings == 1
+
+        # A repeated query returns its cached result as is
+        first = host._scan_assets(True)
+        assert host._scan_assets(True) is first
+        host.search.value = "shot"
+        assert host._scan_assets(True) is host._query_cache["shot"]
+
+        # The least recently used query is evicted past SEARCH_CACHE_SIZE
+        for i in range(SEARCH_CACHE_SIZE):
+            host.names(f"q{i}")
+        assert len(host._query_cache) == SEARCH_CACHE_SIZE
+        assert "shot" not in host._query_cache and "q0" in host._query_cache
+
+        # A refresh without reuse reads the folder again and drops the results
+        assert host.names("shot", reuse_listing=False) == ["shot_c.png", "shot_b.exr", "shot_a.png"]
+        assert host.listings == 2 and list(host._query_cache) == ["shot"]
+
+        # So does a search refresh after a folder change
+        host.current_dir = os.path.join(d, "missing")
+        assert host.names("shot") == [] and host.listings == 3
+    print("✓ Search listing reuse test passed!")
+
+
+if __name__ == "__main__":
+    test_search_reuses_listing()
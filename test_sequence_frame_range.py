@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Test script for image sequence frame range detection in the list view.
+"""
+
+import os
+import sys
+import tempfile
+from functools import partial
+from PySide6.QtWidgets import QApplication
+from src.ui.list_view import AssetListView
+
+# _scan_frame_range only uses self for the static _frame_digits_min_max,
+# so it can be exercised without creating a widget (and a QApplication)
+_scan_frame_range = partial(AssetListView._scan_frame_range, AssetListView)
+
+
+def _touch(directory: str, *names: str):
+    for name in names:
+        open(os.path.join(directory, name), "wb").close()
+
+
+def test_frame_digits_min_max():
+    """Min and max of equal-width frame numbers, leading zeros included."""
+    assert AssetListView._frame_digits_min_max(["0007", "0010", "0003"], 4) == (3, 10)
+    assert AssetListView._frame_digits_min_max(["42"], 2) == (42, 42)
+    assert AssetListView._frame_digits_min_max(["0000", "9999"], 4) == (0, 9999)
+    # Wider than int64 falls back to string comparison
+    wide = ["0" * 19 + "5", "1" + "0" * 19, "0" * 20]
+    assert AssetListView._frame_digits_min_max(wide, 20) == (0, 10 ** 19)
+    print("✓ _frame_digits_min_max test passed!")
+
+
+def test_scan_frame_range():
+    """Sibling frames of the same width give first-last; others are ignored."""
+    with tempfile.TemporaryDirectory() as d:
+        _touch(d, "shot_0101.exr", "shot_0099.exr", "shot_0120.exr",
+               "shot_01000.exr",  # Wider frame number
+               "shot_010.exr",    # Narrower frame number
+               "shot_abcd.exr", "plate_0001.exr")
+        result = _scan_frame_range(d, "shot_0101", "0101")
+        print(f"Sequence range: {result}")
+        assert result == "99-120", result
+
+    with tempfile.TemporaryDirectory() as d:
+        _touch(d, "solo_0007.exr")
+        assert _scan_frame_range(d, "solo_0007", "0007") == "7"
+
+    # A missing directory keeps the current frame
+    missing = os.path.join(tempfile.gettempdir(), "asset_browser_missing_dir")
+    assert _scan_frame_range(missing, "shot_0101", "0101") == "0101"
+    print("✓ _scan_frame_range test passed!")
+
+
+def test_asset_row_scans_its_own_folder():
+    """A list row's frame range comes from the asset's folder, not the working directory."""
+    app = QApplication.instance() or QApplication(sys.argv)
+    view = AssetListView()
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as d, tempfile.TemporaryDirectory() as elsewhere:
+        _touch(d, "shot_0101.exr", "shot_0102.exr", "shot_0110.exr")
+        _touch(elsewhere, "shot_0001.exr", "shot_0200.exr")
+        os.chdir(elsewhere)
+        try:
+            asset = view._read_asset_fields(os.path.join(d, "shot_0101.exr"))
+        finally:
+            os.chdir(cwd)
+    assert asset.frame_range == "101-110", asset.frame_range
+    view.deleteLater()
+    print("✓ Asset row frame range test passed!")
+
+
+if __name__ == "__main__":
+    test_frame_digits_min_max()
+    test_scan_frame_range()
+    test_asset_row_scans_its_own_folder()
@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+Test script for the settings dialog in Asset Browser.
+"""
+
+import sys
+from PySide6.QtWidgets import QApplication
+from src.config.constants import DEFAULT_SETTINGS
+from src.ui.settings_dialog import SettingsDialog
+
+
+def test_unopened_tabs_keep_loaded_values():
+    """Settings loaded into tabs never opened are returned unchanged."""
+    app = QApplication.instance() or QApplication(sys.argv)
+    dialog = SettingsDialog()
+    assert dialog._tab_built == [True, False, False, False]
+
+    formats = dict(DEFAULT_SETTINGS['supported_formats'], **{'.png': False})
+    dialog.load_settings({'thumb_size': 300, 'max_cache_size': 250, 'log_level': "DEBUG",
+                          'supported_formats': {'.png': False}})
+    settings = dialog.get_settings()
+    assert settings['thumb_size'] == 300 and dialog.thumb_size_spin.value() == 300
+    assert settings['max_cache_size'] == 250
+    assert settings['log_level'] == "DEBUG"
+    assert settings['supported_formats'] == formats  # Missing formats fill in as checked
+    assert dialog._tab_built == [True, False, False, False]
+
+    # Opening a tab shows the loaded values, and edits there win from then on
+    dialog.tabs.setCurrentIndex(1)
+    assert dialog._tab_built == [True, True, False, False]
+    assert dialog.max_cache_size.value() == 250
+    dialog.max_cache_size.setValue(500)
+    assert dialog.get_settings()['max_cache_size'] == 500
+
+    # Restore Defaults also reaches the tabs not built yet
+    dialog._restore_defaults()
+    settings = dialog.get_settings()
+    assert settings['max_cache_size'] == 100 and settings['log_level'] == "INFO"
+    assert all(settings['supported_formats'].values())
+    dialog.deleteLater()
+    print("✓ Lazy settings tabs test passed!")
+
+
+if __name__ == "__main__":
+    test_unopened_tabs_keep_loaded_values()
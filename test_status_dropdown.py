@@ -15,7 +15,7 @@ from src.ui.list_view import AssetListView
 
 def test_status_functionality():
     """Test the status editing functionality."""
-    app = QApplication(sys.argv)
+    app = QApplication.instance() or QApplication(sys.argv)
 
     # Create list view
     list_view = AssetListView()
@@ -27,13 +27,13 @@ def test_status_functionality():
     # Verify initial status is "None"
     model = list_view.model
     if len(model.assets) > 0:
-        initial_status = model.assets[0].get('status')
+        initial_status = model.assets[0].status
         print(f"Initial status: {initial_status}")
         assert initial_status == "None", f"Expected 'None', got '{initial_status}'"
 
         # Test setting status programmatically
-        model.assets[0]['status'] = "WIP"
-        updated_status = model.assets[0].get('status')
+        model.assets[0].status = "WIP"
+        updated_status = model.assets[0].status
         print(f"Updated status: {updated_status}")
         assert updated_status == "WIP", f"Expected 'WIP', got '{updated_status}'"
 
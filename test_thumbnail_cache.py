@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Test script for the thumbnail caches and scheduler in Asset Browser.
+"""
+
+import os
+import tempfile
+import threading
+from types import SimpleNamespace
+import numpy as np
+from src.config.constants import THUMB_BATCH_SIZE
+from src.thumbnail.cache import CacheManager, PixmapMemoryCache, PIXMAP_CACHE, ThumbResult, THUMB_FILE_HEADER, THUMB_FILE_MAGIC
+from src.thumbnail.scheduler import ThumbScheduler
+
+
+class _RecordingPool:
+    """Stand-in thread pool that records started tasks instead of running them."""
+
+    def __init__(self, threads: int = 1):
+        self.threads = threads
+        self.started = []
+
+    def maxThreadCount(self) -> int:
+        return self.threads
+
+    def start(self, task):
+        self.started.append(task)
+
+
+def test_cached_thumbnail_round_trip():
+    """A raw THMB file reads back as the same BGR pixels; damaged files read as None."""
+    img = np.random.default_rng(0).integers(0, 256, size=(5, 7, 3), dtype=np.uint8)
+    with tempfile.TemporaryDirectory() as d:
+        path = os.path.join(d, "thumb.bin")
+        CacheManager.write_cached_thumbnail(path, img[:, ::-1])  # Non-contiguous input
+        with open(path, "rb") as f:
+            data = f.read()
+        assert THUMB_FILE_HEADER.unpack_from(data) == (THUMB_FILE_MAGIC, 5, 7, 3)
+        assert len(data) == THUMB_FILE_HEADER.size + img.size
+
+        result = CacheManager.read_cached_thumbnail(path)
+        assert result is not None and result.shape == (5, 7, 3) and result.dtype == np.uint8
+        assert np.array_equal(result, img[:, ::-1])
+
+        with open(path, "wb") as f:  # Truncated pixel data
+            f.write(data[:-1])
+        assert CacheManager.read_cached_thumbnail(path) is None
+        with open(path, "wb") as f:  # Wrong magic
+            f.write(b"PNG\0" + data[4:])
+        assert CacheManager.read_cached_thumbnail(path) is None
+        open(path, "wb").close()  # Empty file
+        assert CacheManager.read_cached_thumbnail(path) is None
+        assert CacheManager.read_cached_thumbnail(os.path.join(d, "missing.bin")) is None
+    print("✓ Cached thumbnail round-trip test passed!")
+
+
+def test_pixmap_memory_cache_eviction():
+    """The least recently used entry is evicted first; get() refreshes recency."""
+    cache = PixmapMemoryCache(3)
+    for key in "abc":
+        cache.put(key, f"pix_{key}", None)
+    assert cache.get("a") == ("pix_a", None)  # a is now most recently used
+    cache.put("d", "pix_d", "meta")
+    assert cache.get("b") is None
+    assert [k for k in "acd" if cache.get(k) is not None] == list("acd")
+
+    cache.put("c", "pix_c2", None)  # Updating an entry also refreshes it
+    cache.set_max_items(2)  # Order is now a, d, c
+    assert cache.get("a") is None
+    assert cache.get("d") == ("pix_d", "meta") and cache.get("c") == ("pix_c2", None)
+
+    cache.set_max_items(0)  # Never below one entry
+    assert cache.max_items == 1
+    cache.clear()
+    assert cache.get("c") is None
+    print("✓ Pixmap memory cache eviction test passed!")
+
+
+def test_scheduler_generation_and_cancel():
+    """Results from a superseded refresh are ignored; reset forgets earlier requests."""
+    io_pool, decode_pool = _RecordingPool(), _RecordingPool()
+    scheduler = ThumbScheduler(decode_pool, io_pool)
+    delivered = []
+    on_done = lambda generation, results: delivered.append((generation, [r.path for r in results]))
+
+    in_view = [f"/shots/in_{i:03d}.exr" for i in range(THUMB_BATCH_SIZE + 1)]
+    hit = "/shots/hit.exr"
+    stats = {path: SimpleNamespace(st_size=len(in_view) - i, st_mtime_ns=1) for i, path in enumerate(in_view)}
+    stats[hit] = SimpleNamespace(st_size=0, st_mtime_ns=1)
+    prefetch = ["/shots/prefetch.exr", in_view[0]]
+    PIXMAP_CACHE.put(PIXMAP_CACHE.key_for(hit, stats[hit]), "pix", "meta")
+    try:
+        cancelled = threading.Event()
+        scheduler.reset("/cache", {}, stats, 1, cancelled, on_done)
+        scheduler.request([hit] + in_view, prefetch)
+    finally:
+        PIXMAP_CACHE.clear()
+    # The memory hit is served at once; one probe per io thread, smallest
+    # in-view files first, prefetch last
+    assert delivered == [(1, [hit])]
+    delivered.clear()
+    assert len(io_pool.started) == 1 and decode_pool.started == []
+    probe = io_pool.started[0]
+    assert probe.paths == in_view[::-1][:THUMB_BATCH_SIZE]
+    assert probe.kind == "probe" and probe.generation == 1 and probe.cancelled is cancelled
+    assert probe.file_stats is stats  # Memory cache keys come from the scan's stats
+    assert scheduler._pending == [in_view[0], "/shots/prefetch.exr"]
+
+    # Cache hits are passed on; misses go to a decode, and the next probe starts
+    hits, misses = probe.paths[:2], probe.paths[2:]
+    scheduler._on_probe_missed(1, misses)
+    scheduler._on_probe_done(1, [ThumbResult(p, "pix", None) for p in hits])
+    assert delivered == [(1, hits)]
+    assert io_pool.started[-1].paths == [in_view[0], "/shots/prefetch.exr"]
+    decode = decode_pool.started[0]
+    assert decode.kind == "decode" and decode.paths == misses and decode.generation == 1
+
+    # A new refresh supersedes generation 1
+    cancelled.set()
+    scheduler.reset("/cache", {}, stats, 2, threading.Event(), on_done)
+    delivered.clear()
+    scheduler._on_probe_missed(1, [in_view[0]])
+    scheduler._on_probe_done(1, [])
+    scheduler._on_decode_done(1, [ThumbResult(p, "pix", None) for p in misses])
+    assert delivered == [] and scheduler._decode_pending == []
+    assert len(io_pool.started) == 2 and len(decode_pool.started) == 1
+
+    # Paths requested before the reset are requested again
+    scheduler.request(in_view[:1])
+    assert io_pool.started[-1].paths == in_view[:1] and io_pool.started[-1].generation == 2
+    scheduler._on_probe_missed(2, in_view[:1])
+    scheduler._on_probe_done(2, [])
+    assert decode_pool.started[-1].paths == in_view[:1] and decode_pool.started[-1].generation == 2
+    scheduler._on_decode_done(2, [ThumbResult(in_view[0], "pix", None)])
+    assert delivered == [(2, in_view[:1])]
+    print("✓ Thumbnail scheduler generation test passed!")
+
+if __name__ == "__main__":
+    test_cached_thumbnail_round_trip()
+    test_pixmap_memory_cache_eviction()
+    test_scheduler_generation_and_cancel()